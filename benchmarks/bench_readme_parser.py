@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+README parser micro-benchmark
+=============================
+
+Times ``ScriptRegistry._parse_readme`` against the original line-by-line
+implementation (kept below as ``legacy_parse_readme``) over synthetic READMEs
+of increasing size, and asserts that both produce identical metadata - for the
+synthetic READMEs, for every README in this repository, and as byte-identical
+``script-registry.json`` output for a synthetic ``scripts/`` tree.
+
+    python benchmarks/bench_readme_parser.py
+    python benchmarks/bench_readme_parser.py --sizes 10 100 1000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from script_manager import ScriptRegistry  # noqa: E402
+
+
+def legacy_parse_readme(content: str, meta: dict[str, Any]) -> None:
+    """The pre-state-machine parser, verbatim - the reference for equivalence."""
+    section: Optional[str] = None
+
+    for line in content.splitlines():
+        stripped = line.strip()
+
+        if stripped.startswith("# ") and not meta["title"]:
+            meta["title"] = stripped[2:].strip()
+            continue
+
+        plain = stripped.replace("*", "").strip()
+        marker = re.match(r"difficulty\s*:\s*(.+)", plain, re.IGNORECASE)
+        if marker:
+            meta["difficulty"] = marker.group(1).strip()
+            continue
+
+        if stripped.startswith("## "):
+            title = re.sub(r"[^\w\s]", "", stripped[3:]).strip().lower()
+            section = "features" if "feature" in title else None
+            continue
+
+        if (
+            section is None
+            and stripped
+            and not stripped.startswith(("#", "```", ">", "!", "|", "*", "-"))
+            and meta["description"] == "No description available"
+        ):
+            meta["description"] = stripped
+            continue
+
+        if section == "features" and stripped.startswith(("- ", "* ")):
+            feature = re.sub(r"\*\*", "", stripped[2:]).strip()
+            meta["features"].append(feature.split(":", 1)[0].strip())
+
+
+def synthetic_readme(n: int, body_sections: int = 6) -> str:
+    """A README shaped like the scaffold template, padded with ``body_sections``
+    usage/example sections of ``n`` lines each. It also carries the awkward
+    cases the parser must keep honouring: a later "Security Features" section,
+    a second Difficulty marker and CRLF line endings in one section."""
+    lines = [
+        f"# Synthetic Tool {n}",
+        "",
+        f"Synthetic tool with {n}-line sections, used to benchmark README parsing.",
+        "",
+        "**Difficulty:** Beginner",
+        "",
+        "## ✨ Features",
+        "",
+    ]
+    lines += [f"- **Feature {i}**: does thing number {i}" for i in range(12)]
+    lines += ["", "## 📋 Requirements", "", "- Python 3.9+", ""]
+    for s in range(body_sections):
+        lines += [f"## 🚀 Usage part {s}", "", "```bash"]
+        lines += [f"python tool.py --option-{i} value  # explain option {i}" for i in range(n)]
+        lines += ["```", ""]
+        lines += [f"Paragraph {i} describing edge cases at length." if i % 10
+                  else f"Defaults for case {i} are documented here." for i in range(n)]
+        lines.append("")
+    lines += ["## 🛡️ Security Features", "", "* Credential protection", "* Rate limiting: on", ""]
+    lines += ["Difficulty: Advanced", "", "## 📄 License", "", "MIT\r\nCRLF line\r\n"]
+    return "\n".join(lines)
+
+
+#: Small READMEs for orderings the synthetic ones do not cover.
+EDGE_CASES = [
+    # A title inside a features section must not stop its bullets being read.
+    "Intro\n## Features\n# Title\n- feat one\n",
+]
+
+
+def new_meta() -> dict[str, Any]:
+    return {
+        "title": "",
+        "description": "No description available",
+        "features": [],
+        "difficulty": "Intermediate",
+    }
+
+
+def check_equivalence(contents: list[str]) -> None:
+    for content in contents:
+        expected, actual = new_meta(), new_meta()
+        legacy_parse_readme(content, expected)
+        ScriptRegistry._parse_readme(content, actual)
+        if expected != actual:
+            raise AssertionError(f"Parser mismatch:\n{expected}\n!=\n{actual}")
+
+
+def check_registry_output(sizes: list[int]) -> None:
+    """Build the same synthetic tree with both parsers; outputs must be identical."""
+
+    class LegacyRegistry(ScriptRegistry):
+        _parse_readme = staticmethod(legacy_parse_readme)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for i, n in enumerate(sizes):
+            tool = root / "scripts" / f"category-{i % 3}" / f"tool-{i}"
+            (tool / "python").mkdir(parents=True)
+            (tool / "python" / "main.py").write_text("print('hi')\n", encoding="utf-8")
+            (tool / "README.md").write_text(synthetic_readme(n), encoding="utf-8")
+
+        outputs = []
+        for cls in (LegacyRegistry, ScriptRegistry):
+            registry = cls(root, use_cache=False)
+            registry.save_registry(registry.scan_tools())
+            outputs.append(registry.registry_file.read_bytes())
+        if outputs[0] != outputs[1]:
+            raise AssertionError("script-registry.json differs between parsers")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000],
+                        help="Lines per body section of the synthetic READMEs.")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Timing repetitions; the best run is reported.")
+    args = parser.parse_args()
+
+    repo_readmes = [p.read_text(encoding="utf-8")
+                    for p in sorted((ROOT / "scripts").glob("*/*/README.md"))]
+    synthetic = [synthetic_readme(n) for n in args.sizes]
+    check_equivalence(repo_readmes + synthetic + EDGE_CASES)
+    check_registry_output(args.sizes)
+    print(f"Equivalence: OK ({len(repo_readmes)} repo + {len(synthetic)} synthetic + "
+          f"{len(EDGE_CASES)} edge-case READMEs, byte-identical registry)")
+
+    print(f"\n{'README size':>14} {'legacy':>12} {'current':>12} {'speedup':>9}")
+    for n, content in zip(args.sizes, synthetic):
+        number = max(1, 2000 // n)
+        timings = []
+        for parse in (legacy_parse_readme, ScriptRegistry._parse_readme):
+            best = min(timeit.repeat(lambda: parse(content, new_meta()),
+                                     number=number, repeat=args.repeat))
+            timings.append(best / number)
+        size = f"{len(content.encode('utf-8')) / 1024:.1f} KiB"
+        print(f"{size:>14} {timings[0] * 1e6:>10.1f}us {timings[1] * 1e6:>10.1f}us "
+              f"{timings[0] / timings[1]:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
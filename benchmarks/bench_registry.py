@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Registry engine benchmark
+=========================
+
+Generates a synthetic ``scripts/`` tree in a temp directory and times the
+operations contributors and CI actually run against it:
+
+* ``scan_cold``      - ``scan_tools`` with the cache disabled
+* ``scan_warm``      - ``scan_tools`` with every tool in the cache
+* ``save_registry``  - writing ``script-registry.json`` from scratch
+* ``website_data``   - ``generate_website_data`` from scratch
+* ``list``           - ``python script_manager.py list`` (in-process)
+* ``add_variant``    - scaffolding a new tool, including the tool lookup
+
+Each operation runs ``--repeat`` times; p50/p95, throughput (tools/s, for the
+operations that touch every tool) and the process peak RSS after it are
+reported. Results can be saved as a baseline and compared against later:
+
+    python benchmarks/bench_registry.py --tools 2000 --save-baseline base.json
+    python benchmarks/bench_registry.py --tools 2000 --baseline base.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import math
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_readme_parser import synthetic_readme  # noqa: E402
+from script_manager import (  # noqa: E402
+    SUPPORTED_LANGUAGES,
+    BuildProfile,
+    ScriptRegistry,
+    cmd_list,
+)
+
+#: Operations whose cost grows with the number of tools; throughput is
+#: reported for these only.
+PER_TOOL_OPS = ("scan_cold", "scan_warm", "save_registry", "website_data")
+
+
+def generate_tree(root: Path, categories: int, tools: int, variants: int, readme_lines: int) -> None:
+    """``tools`` tools spread round-robin over ``categories`` categories, each
+    with ``variants`` language folders and a README of ``readme_lines``-line
+    sections."""
+    languages = list(SUPPORTED_LANGUAGES)[:variants]
+    readme = synthetic_readme(readme_lines)
+    for i in range(tools):
+        tool = root / "scripts" / f"category-{i % categories:03d}" / f"tool-{i:05d}"
+        for language in languages:
+            ext = SUPPORTED_LANGUAGES[language]["ext"]
+            (tool / language).mkdir(parents=True)
+            (tool / language / f"tool-{i:05d}.{ext}").write_text("# synthetic\n", encoding="utf-8")
+        (tool / "README.md").write_text(readme.replace("Synthetic Tool", f"Tool {i}", 1),
+                                        encoding="utf-8")
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def time_op(fn: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+
+    with tempfile.TemporaryDirectory(prefix="nerva-bench-") as tmp:
+        root = Path(tmp)
+        generate_tree(root, args.categories, args.tools, args.variants, args.readme_lines)
+        registry = ScriptRegistry(root, jobs=args.jobs)
+        tools: list[dict[str, Any]] = []
+
+        def scan(use_cache: bool) -> None:
+            nonlocal tools
+            tools = ScriptRegistry(root, use_cache=use_cache, jobs=args.jobs).scan_tools()
+
+        def unlink(path: Path) -> Callable[[], None]:
+            return lambda: path.unlink(missing_ok=True)
+
+        def list_tools() -> None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                cmd_list(ScriptRegistry(root, jobs=args.jobs), argparse.Namespace())
+
+        added = root / "scripts" / "category-000" / "bench-added-tool"
+
+        def add() -> None:
+            ScriptRegistry(root).add_variant("bench-added-tool", "python", category="category-000")
+
+        ops: list[tuple[str, Callable[[], Any], Optional[Callable[[], Any]]]] = [
+            ("scan_cold", lambda: scan(False), None),
+            ("scan_warm", lambda: scan(True), None),
+            # Unlinking first measures a real write, not the unchanged-content skip.
+            ("save_registry", lambda: registry.save_registry(tools), unlink(registry.registry_file)),
+            ("website_data", lambda: registry.generate_website_data(tools),
+             unlink(registry.website_data_file)),
+            ("list", list_tools, None),
+            ("add_variant", add, lambda: shutil.rmtree(added, ignore_errors=True)),
+        ]
+
+        scan(True)  # prime the cache for scan_warm
+        for name, fn, setup in ops:
+            if name == "list":
+                # Leave a registry file stamped for this tree, as ``build`` would,
+                # so ``list`` can take its fast path - and record whether it did.
+                builder = ScriptRegistry(root)
+                builder.save_registry(builder.scan_tools())
+                results["list_fast_path"] = ScriptRegistry(root).load_fresh_registry() is not None
+            samples = time_op(fn, args.repeat, setup)
+            p50 = percentile(samples, 50)
+            results[name] = {
+                "p50Ms": round(p50 * 1000, 3),
+                "p95Ms": round(percentile(samples, 95) * 1000, 3),
+                "toolsPerSec": round(args.tools / p50, 1) if name in PER_TOOL_OPS and p50 else None,
+                "peakRssBytes": BuildProfile.peak_rss(),
+            }
+        shutil.rmtree(added, ignore_errors=True)
+
+    return results
+
+
+def config_of(args: argparse.Namespace) -> dict[str, Any]:
+    return {key: getattr(args, key)
+            for key in ("categories", "tools", "variants", "readme_lines", "repeat", "jobs")}
+
+
+def format_results(results: dict[str, Any], baseline: Optional[dict[str, Any]]) -> str:
+    header = f"{'operation':<15} {'p50':>10} {'p95':>10} {'tools/s':>10} {'peak RSS':>10}"
+    if baseline:
+        header += f" {'vs base':>9}"
+    lines = [header, "-" * len(header)]
+    for name, row in results.items():
+        if not isinstance(row, dict):
+            continue
+        rate = f"{row['toolsPerSec']:.0f}" if row["toolsPerSec"] else "-"
+        rss = f"{row['peakRssBytes'] / 2**20:.1f} MB" if row["peakRssBytes"] else "-"
+        line = (f"{name:<15} {row['p50Ms']:>8.1f}ms {row['p95Ms']:>8.1f}ms "
+                f"{rate:>10} {rss:>10}")
+        before = (baseline or {}).get(name)
+        if before and before.get("p50Ms"):
+            line += f" {(row['p50Ms'] / before['p50Ms'] - 1) * 100:>+8.1f}%"
+        lines.append(line)
+    if not results.get("list_fast_path", True):
+        lines.append("\nwarning: 'list' rescanned instead of reading the fresh registry file")
+    return "\n".join(lines)
+
+
+def regressions(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    slower = []
+    for name, row in results.items():
+        before = baseline.get(name)
+        if isinstance(row, dict) and before and before.get("p50Ms"):
+            if row["p50Ms"] > before["p50Ms"] * (1 + tolerance):
+                slower.append(f"{name}: {before['p50Ms']:.1f}ms -> {row['p50Ms']:.1f}ms")
+    return slower
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--tools", type=int, default=1000, help="Total number of tools.")
+    parser.add_argument("--variants", type=int, default=2,
+                        help=f"Language folders per tool (max {len(SUPPORTED_LANGUAGES)}).")
+    parser.add_argument("--readme-lines", type=int, default=20,
+                        help="Lines per body section of each synthetic README.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per operation.")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Passed to ScriptRegistry.")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare against a saved result.")
+    parser.add_argument("--save-baseline", metavar="FILE", help="Save this result as JSON.")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Allowed p50 slowdown vs. --baseline before exiting 1 (default: 0.10).")
+    args = parser.parse_args()
+
+    if not 1 <= args.variants <= len(SUPPORTED_LANGUAGES):
+        parser.error(f"--variants must be between 1 and {len(SUPPORTED_LANGUAGES)}")
+    if min(args.categories, args.tools, args.repeat, args.jobs) < 1:
+        parser.error("--categories, --tools, --repeat and --jobs must be at least 1")
+
+    logging.getLogger("nerva").setLevel(logging.WARNING)
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        if baseline.get("config") != config_of(args):
+            print(f"note: baseline was recorded with {baseline.get('config')}", file=sys.stderr)
+
+    print(f"{args.tools} tools in {args.categories} categories, {args.variants} variant(s) each, "
+          f"{args.readme_lines}-line README sections, {args.repeat} run(s)\n")
+    results = run(args)
+    print(format_results(results, (baseline or {}).get("results")))
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(
+            json.dumps({"config": config_of(args), "results": results}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        print(f"\nSaved baseline to {args.save_baseline}")
+    if baseline:
+        slower = regressions(results, baseline.get("results", {}), args.tolerance)
+        if slower:
+            print(f"\nSlower than baseline by more than {args.tolerance:.0%}:", *slower, sep="\n  ")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
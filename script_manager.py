@@ -27,11 +27,16 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
 import re
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
+
+# hashlib, concurrent.futures, datetime, select/struct and ctypes are imported
+# where they are used: ``list`` and ``show`` need none of them, and skipping
+# them is a measurable share of the CLI's start-up time.
 
 # --------------------------------------------------------------------------- #
 # Configuration
@@ -69,8 +74,53 @@ CATEGORY_DISPLAY_OVERRIDES = {
     "ai-ml": "AI/ML",
 }
 
+#: ``build --shard`` output: a folder next to scripts.json, and how tools may be
+#: split into shards inside it.
+SHARD_DIR = "registry"
+SHARD_MODES = ("category", "page")
+
+#: Search index written next to scripts.json by ``build``: format version,
+#: prefix-table depth, and words too common to be worth a posting list.
+SEARCH_INDEX_VERSION = 1
+SEARCH_PREFIX_LENGTH = 2
+SEARCH_STOPWORDS = frozenset({
+    "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into",
+    "is", "it", "its", "of", "on", "or", "that", "the", "this", "to", "with",
+})
+
+#: Incremental-build cache, relative to the project root. Bump the version
+#: whenever README parsing, variant detection or content hashing changes so
+#: old entries are discarded instead of reused.
+CACHE_FILE = ".script-cache.json"
+CACHE_VERSION = 3
+
+#: Content hashes recorded for variant files, variants and tools: BLAKE2b
+#: (stdlib, faster than sha256 in pure software) truncated to 128 bits.
+HASH_DIGEST_SIZE = 16
+
+#: Text files are hashed, sized and counted with CRLF read as LF, so a Windows
+#: checkout gives the same registry. Like git, a file with a NUL byte in its
+#: first ``_BINARY_SNIFF`` bytes is binary and taken as it is.
+_BINARY_SNIFF = 8000
+
+#: Records the tree fingerprint that script-registry.json was last built from,
+#: so ``list`` and ``show`` can trust the registry without rescanning.
+REGISTRY_STAMP_FILE = ".script-cache.stamp"
+
 logger = logging.getLogger("nerva")
 
+# README parsing.
+_DIFFICULTY_MARKER = re.compile(r"difficulty\s*:\s*(.+)", re.IGNORECASE)
+_NON_WORD = re.compile(r"[^\w\s]")
+#: First non-blank characters of the only lines that can still matter once a
+#: README's title and description are known: headings, difficulty markers
+#: (possibly wrapped in ``**``) - anything else is skipped without parsing.
+_README_KEY_CHARS = frozenset("#*dD")
+_SEARCH_TOKEN = re.compile(r"[^\W_]+")
+#: How the volatile ``lastUpdated`` line of a stamped output starts; it is left
+#: out when deciding whether the file actually changed.
+_STAMP_LINE = '  "lastUpdated": '
+
 
 def language_rank(language: str) -> int:
     try:
@@ -85,6 +135,151 @@ def slug_to_title(slug: str) -> str:
     return " ".join(word.capitalize() for word in re.split(r"[-_]+", slug) if word)
 
 
+def aggregate_hash(parts: list[str]) -> str:
+    """Content hash over already-hashed ``parts`` (e.g. ``"name:hash"`` lines)."""
+    import hashlib
+
+    digest = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+    for part in parts:
+        digest.update(part.encode("utf-8") + b"\n")
+    return digest.hexdigest()
+
+
+def slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+# --------------------------------------------------------------------------- #
+# Profiling
+# --------------------------------------------------------------------------- #
+
+class _PhaseTimer:
+    __slots__ = ("profile", "name", "start")
+
+    def __init__(self, profile: BuildProfile, name: str) -> None:
+        self.profile = profile
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.profile.add_time(self.name, time.perf_counter() - self.start)
+
+
+class BuildProfile:
+    """Timings and I/O counts collected by ``build --profile``.
+
+    Phase times are summed over worker threads, so with ``--jobs`` they can add
+    up to more than the wall-clock total. "Calls" counts the filesystem calls
+    the registry itself makes (``scandir``, ``stat``, ``open``, ``replace``).
+    """
+
+    enabled = True
+    PHASES = ("discovery", "cache", "readme_read", "parse", "variants", "sort",
+              "search_index", "serialize", "write")
+
+    def __init__(self) -> None:
+        import threading
+
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.wall = 0.0
+        self.phases: dict[str, float] = dict.fromkeys(self.PHASES, 0.0)
+        self.calls = {"scandir": 0, "stat": 0, "open": 0, "replace": 0}
+        self.tools: list[tuple[float, str, bool]] = []
+
+    def phase(self, name: str) -> _PhaseTimer:
+        return _PhaseTimer(self, name)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def count(self, call: str, n: int = 1) -> None:
+        with self._lock:
+            self.calls[call] = self.calls.get(call, 0) + n
+
+    def tool(self, path: str, seconds: float, reused: bool) -> None:
+        with self._lock:
+            self.tools.append((seconds, path, reused))
+
+    def stop(self) -> None:
+        self.wall = time.perf_counter() - self.started
+
+    @staticmethod
+    def peak_rss() -> Optional[int]:
+        """Peak resident set size in bytes, where the platform reports it."""
+        try:
+            import resource
+        except ImportError:  # Windows
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+    def report(self, top: int = 10) -> dict[str, Any]:
+        slowest = sorted(self.tools, reverse=True)[:top]
+        return {
+            "wallMs": round(self.wall * 1000, 3),
+            "phasesMs": {name: round(sec * 1000, 3) for name, sec in self.phases.items()},
+            "calls": dict(self.calls),
+            "peakRssBytes": self.peak_rss(),
+            "tools": len(self.tools),
+            "slowestTools": [
+                {"path": path, "ms": round(sec * 1000, 3), "cached": reused}
+                for sec, path, reused in slowest
+            ],
+        }
+
+    def format_table(self, top: int = 10) -> str:
+        report = self.report(top)
+        wall = report["wallMs"] or 1.0
+        lines = [f"{'Phase':<14} {'ms':>10} {'share':>7}"]
+        for name, ms in report["phasesMs"].items():
+            lines.append(f"{name:<14} {ms:>10.1f} {ms / wall:>7.1%}")
+        lines.append(f"{'total (wall)':<14} {report['wallMs']:>10.1f}")
+        lines.append("")
+        lines.append("Calls: " + " | ".join(f"{k} {v}" for k, v in report["calls"].items()))
+        if report["peakRssBytes"] is not None:
+            lines.append(f"Peak RSS: {report['peakRssBytes'] / (1 << 20):.1f} MiB")
+        if report["slowestTools"]:
+            lines.append(f"\nSlowest {len(report['slowestTools'])} of {report['tools']} tool(s):")
+            for tool in report["slowestTools"]:
+                note = "  (cached)" if tool["cached"] else ""
+                lines.append(f"  {tool['ms']:>8.2f} ms  {tool['path']}{note}")
+        return "\n".join(lines)
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+
+class _NullProfile:
+    """Stand-in used when not profiling; every hook is a no-op."""
+
+    enabled = False
+    _phase = _NullPhase()
+
+    def phase(self, name: str) -> _NullPhase:
+        return self._phase
+
+    def add_time(self, name: str, seconds: float) -> None:
+        pass
+
+    def count(self, call: str, n: int = 1) -> None:
+        pass
+
+    def tool(self, path: str, seconds: float, reused: bool) -> None:
+        pass
+
+
 # --------------------------------------------------------------------------- #
 # Registry engine
 # --------------------------------------------------------------------------- #
@@ -92,55 +287,246 @@ def slug_to_title(slug: str) -> str:
 class ScriptRegistry:
     """Discovers tools, extracts metadata and emits the data files."""
 
-    def __init__(self, root_path: Path | str = ".") -> None:
+    def __init__(
+        self, root_path: Path | str = ".", use_cache: bool = True, jobs: int = 1,
+    ) -> None:
         self.root_path = Path(root_path).resolve()
         self.scripts_path = self.root_path / "scripts"
         self.registry_file = self.root_path / "script-registry.json"
         self.website_data_file = (
             self.root_path / "website" / "public" / "data" / "scripts.json"
         )
+        self.search_index_file = self.website_data_file.with_name("search-index.json")
+        self.cache_file = self.root_path / CACHE_FILE
+        self.stamp_file = self.root_path / REGISTRY_STAMP_FILE
+        self.use_cache = use_cache
+        self.jobs = max(1, jobs)
+        #: Tool slug -> tool folder, filled by ``discover`` and shared with
+        #: ``add_variant`` so looking a tool up never rescans the tree.
+        self._tool_index: Optional[dict[str, Path]] = None
+        #: Digest of every tool's fingerprint as of the last full ``scan_tools``;
+        #: ``None`` once the entries may no longer match the tree.
+        self._tree_digest: Optional[str] = None
+        #: Outcome of the last ``scan_tools`` call: tools reused from the cache
+        #: vs. tools whose README and variants had to be read again.
+        self.stats = {"reused": 0, "reparsed": 0}
+        #: Replaced by a ``BuildProfile`` to collect timings (``build --profile``).
+        self.profile: BuildProfile | _NullProfile = _NullProfile()
 
     # ------------------------------------------------------------------ #
     # Discovery
     # ------------------------------------------------------------------ #
 
     def scan_tools(self) -> list[dict[str, Any]]:
-        """Walk ``scripts/<category>/<tool>/`` and collect one entry per tool."""
+        """Walk ``scripts/<category>/<tool>/`` and collect one entry per tool.
+
+        Tools whose README and language folders are unchanged since the last
+        scan are rebuilt from the on-disk cache instead of being parsed again.
+        With ``jobs > 1`` the per-tool work runs on a thread pool; the result is
+        identical because entries are sorted once everything is collected.
+        """
         if not self.scripts_path.is_dir():
             raise FileNotFoundError(
                 f"Scripts directory not found: {self.scripts_path}. "
                 "Run from the Nerva project root or pass --root."
             )
 
+        profile = self.profile
+        with profile.phase("cache"):
+            cache = self._load_cache()
+        fresh_cache: dict[str, Any] = {}
+        self.stats = {"reused": 0, "reparsed": 0}
         tools: list[dict[str, Any]] = []
 
-        for category_dir in sorted(p for p in self.scripts_path.iterdir() if p.is_dir()):
-            for tool_dir in sorted(p for p in category_dir.iterdir() if p.is_dir()):
-                tool = self._scan_tool(tool_dir, category_dir.name)
-                if tool is None:
-                    logger.warning(
-                        "Skipping %s/%s - no README.md found",
-                        category_dir.name, tool_dir.name,
-                    )
-                    continue
-                if not tool["variants"]:
-                    logger.warning(
-                        "Skipping %s/%s - no language variants found",
-                        category_dir.name, tool_dir.name,
-                    )
-                    continue
-                tools.append(tool)
-                logger.debug("Indexed %s (%d variant(s))",
-                             tool["key"], len(tool["variants"]))
-
-        tools.sort(key=lambda t: (t["category"], t["title"].lower()))
+        with profile.phase("discovery"):
+            locations = self.discover()
+
+        def read(location: tuple[str, Path]) -> Optional[tuple[dict[str, Any], bool]]:
+            key = self._rel(location[1])
+            if not profile.enabled:
+                return self._read_tool(location[1], cache.get(key))
+            start = time.perf_counter()
+            result = self._read_tool(location[1], cache.get(key))
+            profile.tool(key, time.perf_counter() - start, bool(result and result[1]))
+            return result
+
+        if self.jobs > 1 and len(locations) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                results = list(pool.map(read, locations))
+        else:
+            results = [read(location) for location in locations]
+
+        for (category_slug, tool_dir), result in zip(locations, results):
+            if result is None:
+                logger.warning(
+                    "Skipping %s/%s - no README.md found",
+                    category_slug, tool_dir.name,
+                )
+                continue
+            record, reused = result
+            self.stats["reused" if reused else "reparsed"] += 1
+            fresh_cache[self._rel(tool_dir)] = record
+
+            if not record["variants"]:
+                logger.warning(
+                    "Skipping %s/%s - no language variants found",
+                    category_slug, tool_dir.name,
+                )
+                continue
+            tool = self._make_entry(tool_dir, category_slug, record)
+            tools.append(tool)
+            logger.debug("Indexed %s (%d variant(s))",
+                         tool["key"], len(tool["variants"]))
+
+        with profile.phase("cache"):
+            if self.use_cache:
+                self._save_cache(fresh_cache)
+            self._tree_digest = self._digest_tree(
+                [(key, record["fingerprint"]) for key, record in fresh_cache.items()])
+
+        with profile.phase("sort"):
+            tools.sort(key=lambda t: (t["category"], t["title"].lower()))
         return tools
 
-    def _scan_tool(self, tool_dir: Path, category_slug: str) -> Optional[dict[str, Any]]:
-        readme = tool_dir / "README.md"
-        if not readme.exists():
+    def load_fresh_registry(self) -> Optional[list[dict[str, Any]]]:
+        """Tools from ``script-registry.json`` if it still matches the tree.
+
+        The registry is trusted when it is the file the last ``scan``/``build``
+        wrote (same mtime and size) and every tool's fingerprint is unchanged;
+        checking that costs a directory read per folder and no file reads.
+        Returns ``None`` when a rescan is needed.
+        """
+        stamp = self._read_json(self.stamp_file)
+        if not isinstance(stamp, dict) or stamp.get("version") != CACHE_VERSION:
+            return None
+        try:
+            st = self.registry_file.stat()
+        except OSError:
+            return None
+        if stamp.get("registry") != [st.st_mtime_ns, st.st_size]:
             return None
 
+        # Same walk as discover(), kept on plain strings: at thousands of tools
+        # the Path objects would cost more than the directory reads.
+        base = self._rel(self.scripts_path)
+        fingerprints = []
+        for category in self._subdirs(self.scripts_path):
+            for tool in self._subdirs(category.path):
+                stat = self._stat_tool(tool.path)
+                if stat is not None:
+                    fingerprints.append((f"{base}/{category.name}/{tool.name}", stat[1]))
+        if stamp.get("tree") != self._digest_tree(fingerprints):
+            return None
+
+        data = self._read_json(self.registry_file)
+        if not isinstance(data, dict) or not isinstance(data.get("tools"), list):
+            return None
+        logger.debug("Using %s (up to date)", self._rel(self.registry_file))
+        return data["tools"]
+
+    @staticmethod
+    def _digest_tree(fingerprints: list[tuple[str, Any]]) -> str:
+        import hashlib
+
+        return hashlib.sha256(json.dumps(fingerprints).encode("utf-8")).hexdigest()
+
+    def discover(self) -> list[tuple[str, Path]]:
+        """Return ``(category_slug, tool_dir)`` for every tool folder, sorted.
+
+        A single ``os.scandir`` pass over ``scripts/`` and each category: the
+        directory type comes from the cached ``DirEntry`` data, so this costs
+        one directory read per category rather than a stat per entry. Also
+        (re)builds the tool-slug index used by ``_find_tool``.
+        """
+        locations: list[tuple[str, Path]] = []
+        index: dict[str, Path] = {}
+        categories = self._subdirs(self.scripts_path)
+        self.profile.count("scandir", 1 + len(categories))
+        for category in categories:
+            for tool in self._subdirs(category.path):
+                tool_dir = Path(tool.path)
+                locations.append((category.name, tool_dir))
+                index.setdefault(tool.name, tool_dir)
+        self._tool_index = index
+        return locations
+
+    @staticmethod
+    def _subdirs(path: str | Path) -> list[os.DirEntry]:
+        try:
+            with os.scandir(path) as it:
+                return sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+        except OSError:
+            return []
+
+    def _read_tool(
+        self, tool_dir: Path, cached: Optional[dict[str, Any]] = None,
+    ) -> Optional[tuple[dict[str, Any], bool]]:
+        """Return ``(record, reused)`` for one tool, or ``None`` without a README.
+
+        ``record`` holds the fingerprint, parsed README metadata, the README
+        and tool hashes and the variants with their file listings. It is
+        ``cached`` itself when the fingerprint still matches; otherwise only
+        what changed is re-read - the README when its own stats moved, and
+        each file whose (mtime, size, inode) differs from the cached one.
+        Safe to call from worker threads - it only touches the filesystem.
+        """
+        profile = self.profile
+        with profile.phase("discovery"):
+            stat = self._stat_tool(tool_dir)
+        if stat is None:
+            return None
+        files, fingerprint = stat
+        if cached is not None and cached.get("fingerprint") == fingerprint:
+            return cached, True
+
+        previous: dict[str, Any] = {}
+        known: dict[str, dict[str, Any]] = {}
+        if cached is not None:
+            previous = {row[0]: row[1:] for row in cached.get("fingerprint", [])}
+            known = {f"{variant['language']}/{info['name']}": info
+                     for variant in cached.get("variants", [])
+                     for info in variant.get("files", [])}
+
+        if cached is not None and previous.get("README.md") == fingerprint[0][1:]:
+            meta, readme_hash = cached["meta"], cached["readme"]
+        else:
+            meta, readme_hash = self._read_readme(tool_dir / "README.md")
+
+        with profile.phase("variants"):
+            current = {row[0]: row[1:] for row in fingerprint}
+            variants = []
+            for language, found in files.items():
+                listing = []
+                for entry in found:
+                    key = f"{language}/{entry.name}"
+                    info = known.get(key) if previous.get(key) == current.get(key) else None
+                    if info is None:
+                        info = self._describe_file(entry)
+                    if info is not None:
+                        listing.append(info)
+                if not listing:
+                    continue
+                variants.append({
+                    "language": language,
+                    "path": self._rel(tool_dir / language),
+                    "hash": aggregate_hash([f"{info['name']}:{info['hash']}" for info in listing]),
+                    "size": sum(info["size"] for info in listing),
+                    "lines": sum(info["lines"] for info in listing),
+                    "files": listing,
+                })
+            variants.sort(key=lambda v: language_rank(v["language"]))
+
+        tool_hash = aggregate_hash([f"README.md:{readme_hash}",
+                                    *(f"{v['language']}:{v['hash']}" for v in variants)])
+        return {"fingerprint": fingerprint, "meta": meta, "readme": readme_hash,
+                "hash": tool_hash, "variants": variants}, False
+
+    def _read_readme(self, readme: Path) -> tuple[dict[str, Any], Optional[str]]:
+        """Parsed metadata and content hash of a README (defaults if unreadable)."""
+        import hashlib
+
         meta = {
             "title": "",
             "description": "No description available",
@@ -148,21 +534,99 @@ class ScriptRegistry:
             "difficulty": "Intermediate",
         }
         try:
-            self._parse_readme(readme.read_text(encoding="utf-8"), meta)
+            with self.profile.phase("readme_read"):
+                self.profile.count("open")
+                data = readme.read_bytes()
+                if b"\0" not in data[:_BINARY_SNIFF]:
+                    data = data.replace(b"\r\n", b"\n")
+            with self.profile.phase("parse"):
+                self._parse_readme(data.decode("utf-8"), meta)
         except OSError as exc:
             logger.error("Could not read %s: %s", readme, exc)
+            return meta, None
+        return meta, hashlib.blake2b(data, digest_size=HASH_DIGEST_SIZE).hexdigest()
 
-        variants = []
-        for sub in tool_dir.iterdir():
-            if (sub.is_dir()
-                    and sub.name in SUPPORTED_LANGUAGES
-                    and any(f.is_file() for f in sub.iterdir())):
-                variants.append({
-                    "language": sub.name,
-                    "path": self._rel(sub),
-                })
-        variants.sort(key=lambda v: language_rank(v["language"]))
+    def _describe_file(self, entry: os.DirEntry) -> Optional[dict[str, Any]]:
+        """``{"name", "size", "lines", "hash"}`` for one variant file, read in blocks.
 
+        ``size`` is what was actually read, so it always agrees with the hash;
+        in text files both see CRLF as LF.
+        """
+        import hashlib
+
+        digest = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+        size = lines = 0
+        last = b"\n"
+        text = None
+        carry = b""  # a trailing CR, held back in case the next block starts with LF
+        self.profile.count("open")
+        try:
+            with open(entry.path, "rb") as fh:
+                for block in iter(lambda: fh.read(1 << 16), b""):
+                    if text is None:
+                        text = b"\0" not in block[:_BINARY_SNIFF]
+                    if text:
+                        block = carry + block
+                        carry = b"\r" if block.endswith(b"\r") else b""
+                        block = block[:len(block) - len(carry)].replace(b"\r\n", b"\n")
+                        if not block:
+                            continue
+                    digest.update(block)
+                    size += len(block)
+                    lines += block.count(b"\n")
+                    last = block[-1:]
+            if carry:
+                digest.update(carry)
+                size += 1
+                last = carry
+        except OSError as exc:
+            logger.warning("Could not read %s: %s", entry.path, exc)
+            return None
+        if last != b"\n":
+            lines += 1  # unterminated last line
+        return {"name": entry.name, "size": size, "lines": lines, "hash": digest.hexdigest()}
+
+    def _stat_tool(
+        self, tool_dir: str | Path,
+    ) -> Optional[tuple[dict[str, list[os.DirEntry]], list[list[Any]]]]:
+        """Read a tool folder and its language folders: ``(files, fingerprint)``.
+
+        ``files`` maps each language folder holding at least one file to those
+        files, sorted by name. Returns ``None`` if the folder is gone or has
+        no README.
+        """
+        try:
+            with os.scandir(tool_dir) as it:
+                entries = {e.name: e for e in it
+                           if e.name == "README.md" or e.name in SUPPORTED_LANGUAGES}
+        except OSError:
+            return None
+        if "README.md" not in entries:
+            return None
+
+        files: dict[str, list[os.DirEntry]] = {}
+        for language in sorted(name for name, entry in entries.items()
+                               if name != "README.md" and entry.is_dir()):
+            self.profile.count("scandir")
+            try:
+                with os.scandir(entries[language].path) as it:
+                    found = sorted((e for e in it if e.is_file()), key=lambda e: e.name)
+            except OSError:
+                continue
+            if found:
+                files[language] = found
+        self.profile.count("scandir")
+        self.profile.count("stat", 1 + sum(len(found) for found in files.values()))
+
+        fingerprint = self._fingerprint(entries["README.md"], files)
+        if fingerprint is None:
+            return None
+        return files, fingerprint
+
+    def _make_entry(
+        self, tool_dir: Path, category_slug: str, record: dict[str, Any],
+    ) -> dict[str, Any]:
+        meta = record["meta"]
         return {
             "key": tool_dir.name,
             "title": meta["title"] or slug_to_title(tool_dir.name),
@@ -172,33 +636,71 @@ class ScriptRegistry:
             "features": meta["features"],
             "featured": tool_dir.name in ALWAYS_FEATURED,
             "path": self._rel(tool_dir),
-            "variants": variants,
+            "hash": record["hash"],
+            "variants": record["variants"],
         }
 
+    @staticmethod
+    def _fingerprint(
+        readme: os.DirEntry, files: dict[str, list[os.DirEntry]],
+    ) -> Optional[list[list[Any]]]:
+        """(name, mtime, size, inode) of the README and of every variant file.
+
+        Variant files are named ``<language>/<file>``. Any edit, addition or
+        removal shows up here, so both variant detection and the content
+        hashes can be reused from the cache whenever it matches. Returns
+        ``None`` if the README vanished while scanning.
+        """
+        try:
+            st = readme.stat()
+        except OSError:
+            return None
+        parts = [["README.md", st.st_mtime_ns, st.st_size, st.st_ino]]
+        for language, found in files.items():
+            for entry in found:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                parts.append([f"{language}/{entry.name}", st.st_mtime_ns, st.st_size, st.st_ino])
+        return parts
+
     @staticmethod
     def _parse_readme(content: str, meta: dict[str, Any]) -> None:
-        """Populate ``meta`` in place from raw README ``content``."""
+        """Populate ``meta`` in place from raw README ``content``.
+
+        A line-by-line state machine over precompiled patterns. Once the title
+        and description are known and we are outside a features section, only
+        a ``## `` heading or a ``Difficulty:`` marker can still change ``meta``
+        (later "... Features" sections add tags and the last marker wins), so
+        every other line is dismissed by its first character alone.
+        """
         section: Optional[str] = None
+        settled = False
 
         for line in content.splitlines():
+            if settled and line.lstrip()[:1] not in _README_KEY_CHARS:
+                continue
             stripped = line.strip()
 
             if stripped.startswith("# ") and not meta["title"]:
                 meta["title"] = stripped[2:].strip()
+                settled = section is None and meta["description"] != "No description available"
                 continue
 
             # Inline difficulty marker like "**Difficulty:** Beginner" (the colon
             # may sit inside or outside the bold, so match on a *-stripped line).
             # Category is intentionally NOT read here — the folder is authoritative.
-            plain = stripped.replace("*", "").strip()
-            marker = re.match(r"difficulty\s*:\s*(.+)", plain, re.IGNORECASE)
+            marker = _DIFFICULTY_MARKER.match(stripped.replace("*", "").strip())
             if marker:
                 meta["difficulty"] = marker.group(1).strip()
                 continue
 
             if stripped.startswith("## "):
-                title = re.sub(r"[^\w\s]", "", stripped[3:]).strip().lower()
+                title = _NON_WORD.sub("", stripped[3:]).strip().lower()
                 section = "features" if "feature" in title else None
+                settled = section is None and bool(meta["title"]) and (
+                    meta["description"] != "No description available")
                 continue
 
             if (
@@ -208,10 +710,11 @@ class ScriptRegistry:
                 and meta["description"] == "No description available"
             ):
                 meta["description"] = stripped
+                settled = bool(meta["title"])
                 continue
 
             if section == "features" and stripped.startswith(("- ", "* ")):
-                feature = re.sub(r"\*\*", "", stripped[2:]).strip()
+                feature = stripped[2:].replace("**", "").strip()
                 # Keep tags short and tidy: drop any "Label: explanation" detail.
                 meta["features"].append(feature.split(":", 1)[0].strip())
 
@@ -220,25 +723,33 @@ class ScriptRegistry:
     # ------------------------------------------------------------------ #
 
     def save_registry(self, tools: list[dict[str, Any]]) -> None:
-        self._write_json(self.registry_file, {"tools": tools})
-        logger.info("Registry saved to %s", self._rel(self.registry_file))
+        if self._write_json(self.registry_file, {"tools": tools}):
+            logger.info("Registry saved to %s", self._rel(self.registry_file))
+        else:
+            logger.info("Registry unchanged: %s", self._rel(self.registry_file))
+        self._save_stamp()
+
+    def _save_stamp(self) -> None:
+        """Remember which tree the registry file reflects (see ``load_fresh_registry``)."""
+        try:
+            if self._tree_digest is None:
+                self.stamp_file.unlink(missing_ok=True)
+                return
+            st = self.registry_file.stat()
+            self.stamp_file.write_text(json.dumps({
+                "version": CACHE_VERSION,
+                "tree": self._tree_digest,
+                "registry": [st.st_mtime_ns, st.st_size],
+            }) + "\n", encoding="utf-8")
+        except OSError as exc:
+            logger.debug("Could not update %s: %s", self._rel(self.stamp_file), exc)
 
     def generate_website_data(self, tools: list[dict[str, Any]]) -> dict[str, Any]:
-        languages = {lang: {"count": 0} for lang in SUPPORTED_LANGUAGES}
-        categories: dict[str, int] = {}
-        total_variants = 0
-
-        for tool in tools:
-            categories[tool["category"]] = categories.get(tool["category"], 0) + 1
-            for variant in tool["variants"]:
-                total_variants += 1
-                languages.setdefault(variant["language"], {"count": 0})
-                languages[variant["language"]]["count"] += 1
-
-        featured = [t for t in tools if t["featured"]] or tools[:FALLBACK_FEATURED_COUNT]
+        languages, categories, total_variants = self._summarize(tools)
+        featured = self._featured(tools)
 
         website_data = {
-            "lastUpdated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "lastUpdated": None,
             "totalTools": len(tools),
             "totalScripts": total_variants,
             "languages": languages,
@@ -248,15 +759,249 @@ class ScriptRegistry:
         }
 
         self.website_data_file.parent.mkdir(parents=True, exist_ok=True)
-        self._write_json(self.website_data_file, website_data)
-
-        logger.info("Website data generated at %s", self._rel(self.website_data_file))
+        if self._write_stamped(self.website_data_file, website_data):
+            logger.info("Website data generated at %s", self._rel(self.website_data_file))
+        else:
+            logger.info("Website data unchanged: %s", self._rel(self.website_data_file))
         logger.info(
             "Tools: %d | Variants: %d | Featured: %d",
             len(tools), total_variants, len(featured),
         )
         return website_data
 
+    def generate_shards(
+        self, tools: list[dict[str, Any]], mode: str = "category", page_size: int = 50,
+    ) -> dict[str, Any]:
+        """Write the lazy-loadable form of the website data under ``data/registry/``.
+
+        * ``index.json``        - totals, per-language/category counts, featured
+                                  keys and where the shards are; its size does
+                                  not grow with the number of tools
+        * ``categories/<slug>.json`` (``mode="category"``) or
+          ``pages/<n>.json`` (``mode="page"``, ``page_size`` tools each)
+        * ``tools/<key>.json``  - one detail file per tool
+
+        Shard files that no longer correspond to anything are removed.
+        """
+        if mode not in SHARD_MODES:
+            raise ValueError(f"Unknown shard mode '{mode}'. Choose from: {', '.join(SHARD_MODES)}.")
+        if page_size < 1:
+            raise ValueError("Page size must be at least 1.")
+
+        out_dir = self.website_data_file.parent / SHARD_DIR
+        written: set[Path] = set()
+
+        def emit(rel: str, data: Any) -> None:
+            path = out_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_json(path, data)
+            written.add(path)
+
+        shards: list[dict[str, Any]] = []
+        page_count = 0
+        if mode == "category":
+            by_slug: dict[str, list[dict[str, Any]]] = {}
+            for tool in tools:
+                by_slug.setdefault(Path(tool["path"]).parent.name, []).append(tool)
+            for slug, bucket in by_slug.items():
+                rel = f"categories/{slug}.json"
+                emit(rel, {"category": bucket[0]["category"], "tools": bucket})
+                shards.append({"file": rel, "category": bucket[0]["category"],
+                               "count": len(bucket)})
+        else:
+            page_count = (len(tools) + page_size - 1) // page_size
+            for number in range(1, page_count + 1):
+                bucket = tools[(number - 1) * page_size:number * page_size]
+                rel = f"pages/{number}.json"
+                emit(rel, {"page": number, "pageCount": page_count, "tools": bucket})
+
+        for tool in tools:
+            emit(f"tools/{tool['key']}.json", tool)
+
+        languages, categories, total_variants = self._summarize(tools)
+        index = {
+            "lastUpdated": None,
+            "totalTools": len(tools),
+            "totalScripts": total_variants,
+            "languages": languages,
+            "categories": categories,
+            "featured": [tool["key"] for tool in self._featured(tools)],
+            "shardMode": mode,
+        }
+        if mode == "category":
+            index["shards"] = shards
+        else:
+            # A file pattern rather than a list, so the index stays the same
+            # size however many pages there are.
+            index["pages"] = {"count": page_count, "size": page_size,
+                              "file": "pages/{page}.json"}
+        index_file = out_dir / "index.json"
+        self._write_stamped(index_file, index)
+        written.add(index_file)
+
+        for stale in out_dir.glob("*/*.json"):
+            if stale not in written:
+                stale.unlink()
+        for sub in out_dir.iterdir():
+            if sub.is_dir() and not any(sub.iterdir()):
+                sub.rmdir()
+        logger.info("Website shards generated in %s (%d %s shard(s), %d tool file(s))",
+                    self._rel(out_dir), len(shards) or page_count, mode, len(tools))
+        return index
+
+    def generate_search_index(self, tools: list[dict[str, Any]]) -> dict[str, Any]:
+        """Write an inverted index so the site can search without a linear scan.
+
+        Layout (compact JSON, ``search-index.json`` next to ``scripts.json``):
+
+        * ``docs``      - tool keys; a posting is an index into this list
+        * ``terms``     - every distinct token, sorted
+        * ``postings``  - ``postings[i]`` lists the docs containing ``terms[i]``
+        * ``prefixes``  - 1- and 2-character prefix -> ``[start, end)`` slice of
+                          ``terms``, so a partial word narrows to a handful of
+                          terms before a binary search
+
+        Tokens come from each tool's key, title, description, features,
+        category and variant languages.
+        """
+        with self.profile.phase("search_index"):
+            index = self._build_search_index(tools)
+        self.search_index_file.parent.mkdir(parents=True, exist_ok=True)
+        if self._write_json(self.search_index_file, index, compact=True):
+            logger.info("Search index generated at %s (%d terms)",
+                        self._rel(self.search_index_file), len(index["terms"]))
+        else:
+            logger.info("Search index unchanged: %s", self._rel(self.search_index_file))
+        return index
+
+    @classmethod
+    def _build_search_index(cls, tools: list[dict[str, Any]]) -> dict[str, Any]:
+        postings: dict[str, set[int]] = {}
+        for doc, tool in enumerate(tools):
+            text = " ".join([
+                tool["key"], tool["title"], tool["description"], *tool["features"],
+                tool["category"], *(v["language"] for v in tool["variants"]),
+            ])
+            for term in cls._tokenize(text):
+                postings.setdefault(term, set()).add(doc)
+
+        terms = sorted(postings)
+        prefixes: dict[str, list[int]] = {}
+        for position, term in enumerate(terms):
+            for length in range(1, SEARCH_PREFIX_LENGTH + 1):
+                if len(term) >= length:
+                    span = prefixes.setdefault(term[:length], [position, position])
+                    span[1] = position + 1
+
+        return {
+            "version": SEARCH_INDEX_VERSION,
+            "docs": [tool["key"] for tool in tools],
+            "terms": terms,
+            "postings": [sorted(postings[term]) for term in terms],
+            "prefixes": prefixes,
+        }
+
+    @staticmethod
+    def _tokenize(text: str) -> set[str]:
+        return {token for token in _SEARCH_TOKEN.findall(text.lower())
+                if len(token) > 1 and token not in SEARCH_STOPWORDS}
+
+    @staticmethod
+    def _summarize(
+        tools: list[dict[str, Any]],
+    ) -> tuple[dict[str, dict[str, int]], dict[str, int], int]:
+        """Per-language variant counts, per-category tool counts, total variants."""
+        languages = {lang: {"count": 0} for lang in SUPPORTED_LANGUAGES}
+        categories: dict[str, int] = {}
+        total_variants = 0
+
+        for tool in tools:
+            categories[tool["category"]] = categories.get(tool["category"], 0) + 1
+            for variant in tool["variants"]:
+                total_variants += 1
+                languages.setdefault(variant["language"], {"count": 0})
+                languages[variant["language"]]["count"] += 1
+        return languages, categories, total_variants
+
+    @staticmethod
+    def _featured(tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return [t for t in tools if t["featured"]] or tools[:FALLBACK_FEATURED_COUNT]
+
+    # ------------------------------------------------------------------ #
+    # Watching
+    # ------------------------------------------------------------------ #
+
+    def watch(
+        self,
+        debounce: float = 0.2,
+        poll_interval: float = 1.0,
+        force_poll: bool = False,
+    ) -> None:
+        """Keep both data files in sync with ``scripts/`` until interrupted.
+
+        After an initial full build, filesystem events (inotify on Linux,
+        fingerprint polling elsewhere or with ``force_poll``) are collected
+        until ``debounce`` seconds pass without another one; only the tools
+        they touch are re-read before both files are rewritten.
+        """
+        entries = {tool["path"]: tool for tool in self.scan_tools()}
+        self._publish(entries)
+
+        watcher = _make_watcher(self, poll_interval, force_poll)
+        logger.info("Watching %s with %s - press Ctrl+C to stop.",
+                    self._rel(self.scripts_path), watcher.name)
+        try:
+            while True:
+                changed = watcher.wait(None)
+                while True:
+                    more = watcher.wait(debounce)
+                    if not more:
+                        break
+                    changed |= more
+                if changed:
+                    self._apply_changes(entries, changed)
+                    self._publish(entries)
+        finally:
+            watcher.close()
+
+    def _apply_changes(self, entries: dict[str, dict[str, Any]], changed: set[Path]) -> None:
+        """Refresh ``entries`` (keyed by tool path) for the changed paths."""
+        self._tree_digest = None  # partial refresh: the stamp can't vouch for it
+        tool_dirs: set[Path] = set()
+        for path in changed:
+            try:
+                parts = path.relative_to(self.scripts_path).parts
+            except ValueError:
+                continue
+            if not parts:
+                entries.clear()
+                entries.update((t["path"], t) for t in self.scan_tools())
+                return
+            if len(parts) == 1:
+                # A whole category appeared, vanished or was renamed.
+                prefix = self._rel(self.scripts_path / parts[0]) + "/"
+                tool_dirs.update(self.root_path / key for key in entries
+                                 if key.startswith(prefix))
+                tool_dirs.update(Path(e.path) for e in self._subdirs(path))
+            else:
+                tool_dirs.add(self.scripts_path / parts[0] / parts[1])
+
+        for tool_dir in sorted(tool_dirs):
+            key = self._rel(tool_dir)
+            result = self._read_tool(tool_dir)
+            if result is None or not result[0]["variants"]:
+                if entries.pop(key, None) is not None:
+                    logger.info("Removed %s", key)
+                continue
+            entries[key] = self._make_entry(tool_dir, tool_dir.parent.name, result[0])
+            logger.info("Updated %s", key)
+
+    def _publish(self, entries: dict[str, dict[str, Any]]) -> None:
+        tools = sorted(entries.values(), key=lambda t: (t["category"], t["title"].lower()))
+        self.save_registry(tools)
+        self.generate_website_data(tools)
+        self.generate_search_index(tools)
+
     # ------------------------------------------------------------------ #
     # Scaffolding
     # ------------------------------------------------------------------ #
@@ -280,13 +1025,13 @@ class ScriptRegistry:
                 f"Choose from: {', '.join(SUPPORTED_LANGUAGES)}."
             )
 
-        tool_slug = re.sub(r"[^a-z0-9]+", "-", tool.lower()).strip("-")
+        tool_slug = slugify(tool)
         if not tool_slug:
             raise ValueError(f"Invalid tool name: {tool!r}")
 
         tool_dir = self._find_tool(tool_slug)
         if tool_dir is None:
-            category_slug = re.sub(r"[^a-z0-9]+", "-", category.lower()).strip("-") or "utility"
+            category_slug = slugify(category) or "utility"
             tool_dir = self.scripts_path / category_slug / tool_slug
 
         variant_dir = tool_dir / language
@@ -315,19 +1060,89 @@ class ScriptRegistry:
         readme = tool_dir / "README.md"
         if not readme.exists():
             self._write_text(readme, self._readme_template(title, difficulty), force)
+        if self._tool_index is not None:
+            self._tool_index.setdefault(tool_slug, tool_dir)
 
         logger.info("Variant scaffolded at %s", self._rel(variant_dir))
         return variant_dir
 
+    def add_variants(
+        self,
+        items: list[dict[str, Any]],
+        category: str = "utility",
+        difficulty: str = "Intermediate",
+        force: bool = False,
+    ) -> list[dict[str, Any]]:
+        """``add_variant`` for each ``{"tool", "language"[, "category", "difficulty"]}``
+        item, with ``category`` / ``difficulty`` as fallbacks.
+
+        All lookups share one discovery pass (new tools are added to the index
+        as they are created, so a manifest may add several languages to a tool
+        it introduces), and a failing item is reported without aborting the
+        rest. Returns one ``{"tool", "language", "path" | "error"}`` per item.
+        """
+        results = []
+        for item in items:
+            result: dict[str, Any] = {
+                "tool": str(item.get("tool") or ""),
+                "language": str(item.get("language") or ""),
+            }
+            try:
+                variant_dir = self.add_variant(
+                    result["tool"], result["language"],
+                    str(item.get("category") or category),
+                    str(item.get("difficulty") or difficulty),
+                    force,
+                )
+            except (ValueError, OSError) as exc:
+                logger.error("Skipped %s/%s: %s",
+                             result["tool"] or "?", result["language"] or "?", exc)
+                result["error"] = str(exc)
+            else:
+                result["path"] = self._rel(variant_dir)
+            results.append(result)
+        return results
+
+    @staticmethod
+    def read_manifest(path: Path) -> list[dict[str, Any]]:
+        """Items for ``add_variants`` from a ``.json`` or ``.csv`` manifest.
+
+        JSON is a list of objects (or ``{"tools": [...]}``); an object may give
+        a ``languages`` list instead of a single ``language``. CSV has a header
+        row naming ``tool``, ``language`` and optionally ``category`` and
+        ``difficulty`` columns, one variant per row.
+        """
+        if path.suffix.lower() == ".csv":
+            import csv
+
+            with path.open(newline="", encoding="utf-8-sig") as fh:
+                return [{key.strip().lower(): (value or "").strip()
+                         for key, value in row.items() if key}
+                        for row in csv.DictReader(fh)]
+
+        data = json.loads(path.read_text(encoding="utf-8-sig"))
+        if isinstance(data, dict):
+            data = data.get("tools")
+        if not isinstance(data, list):
+            raise ValueError(f"{path}: expected a list of tools or {{\"tools\": [...]}}.")
+        items = []
+        for entry in data:
+            if not isinstance(entry, dict):
+                raise ValueError(f"{path}: manifest entries must be objects, got {entry!r}.")
+            languages = entry.get("languages")
+            if isinstance(languages, list):
+                items.extend({**entry, "language": language} for language in languages)
+            else:
+                items.append(entry)
+        return items
+
     def _find_tool(self, tool_slug: str) -> Optional[Path]:
         """Return the existing tool folder for ``tool_slug``, if any."""
-        if not self.scripts_path.is_dir():
-            return None
-        for category_dir in self.scripts_path.iterdir():
-            candidate = category_dir / tool_slug
-            if category_dir.is_dir() and candidate.is_dir():
-                return candidate
-        return None
+        if self._tool_index is None:
+            if not self.scripts_path.is_dir():
+                return None
+            self.discover()
+        return self._tool_index.get(tool_slug)
 
     @staticmethod
     def _readme_template(title: str, difficulty: str) -> str:
@@ -389,6 +1204,29 @@ python python/{title.lower().replace(' ', '-')}.py
     # Helpers
     # ------------------------------------------------------------------ #
 
+    def _load_cache(self) -> dict[str, Any]:
+        if not self.use_cache:
+            return {}
+        self.profile.count("open")
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            logger.debug("Ignoring stale cache %s", self._rel(self.cache_file))
+            return {}
+        return data.get("tools", {})
+
+    def _save_cache(self, tools: dict[str, Any]) -> None:
+        self.profile.count("open")
+        try:
+            with self.cache_file.open("w", encoding="utf-8", newline="\n") as fh:
+                for chunk in self._json_chunks({"version": CACHE_VERSION, "tools": tools},
+                                               compact=True):
+                    fh.write(chunk)
+        except OSError as exc:
+            logger.warning("Could not write cache %s: %s", self._rel(self.cache_file), exc)
+
     def _rel(self, path: Path) -> str:
         try:
             return str(path.relative_to(self.root_path)).replace("\\", "/")
@@ -396,10 +1234,161 @@ python python/{title.lower().replace(' ', '-')}.py
             return str(path)
 
     @staticmethod
-    def _write_json(path: Path, data: Any) -> None:
-        path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8",
-        )
+    def _json_chunks(data: Any, compact: bool = False) -> Iterator[str]:
+        """Yield ``data`` as JSON text, one element of each top-level list or
+        object at a time.
+
+        The concatenation is byte-identical to ``json.dumps(data, indent=2)``
+        (or the compact form) plus a trailing newline, but only one tool's worth
+        of text exists at any moment, so writing a huge registry costs no more
+        memory than the tool dicts themselves.
+        """
+        def dump(value: Any, indent: str) -> str:
+            if compact:
+                return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+            return json.dumps(value, ensure_ascii=False, indent=2).replace("\n", "\n" + indent)
+
+        outer, inner = ("", "") if compact else ("\n  ", "\n    ")
+        colon = ":" if compact else ": "
+        if not isinstance(data, dict) or not data:
+            yield dump(data, "") + "\n"
+            return
+
+        yield "{"
+        for i, (key, value) in enumerate(data.items()):
+            yield ("," if i else "") + outer + json.dumps(key, ensure_ascii=False) + colon
+            if not isinstance(value, (list, dict)) or not value:
+                yield dump(value, "  ")
+                continue
+            is_list = isinstance(value, list)
+            yield "[" if is_list else "{"
+            for j, item in enumerate(value if is_list else value.items()):
+                if is_list:
+                    text = dump(item, "    ")
+                else:
+                    text = json.dumps(item[0], ensure_ascii=False) + colon + dump(item[1], "    ")
+                yield ("," if j else "") + inner + text
+            yield outer + ("]" if is_list else "}")
+        yield "}\n" if compact else "\n}\n"
+
+    @staticmethod
+    def _digesting(chunks: Iterator[str], digest: Any, skip: Optional[str] = None) -> Iterator[str]:
+        """Pass ``chunks`` through, feeding their UTF-8 bytes to ``digest``.
+
+        The bytes hashed are those ``_file_digest`` would hash reading the
+        result back from disk: with ``skip``, the first line starting with it
+        is left out. Only the current unfinished line is buffered, and only
+        until that line has been found.
+        """
+        pending: Optional[str] = "" if skip is not None else None
+        for chunk in chunks:
+            yield chunk
+            if pending is None:
+                digest.update(chunk.encode("utf-8"))
+                continue
+            lines = (pending + chunk).split("\n")
+            pending = lines.pop()
+            for i, line in enumerate(lines):
+                if line.startswith(skip):
+                    rest = lines[i + 1:] + [pending]
+                    digest.update("\n".join(rest).encode("utf-8"))
+                    pending = None
+                    break
+                digest.update((line + "\n").encode("utf-8"))
+        if pending:
+            digest.update(pending.encode("utf-8"))
+
+    def _file_digest(
+        self, path: Path, skip: Optional[str] = None,
+    ) -> tuple[Optional[bytes], Optional[str]]:
+        """sha256 of ``path`` (``None`` if unreadable).
+
+        With ``skip``, the first line starting with it is left out of the hash
+        and returned alongside it.
+        """
+        import hashlib
+
+        digest = hashlib.sha256()
+        skipped = None
+        self.profile.count("open")
+        try:
+            with path.open("rb") as fh:
+                if skip is None:
+                    for block in iter(lambda: fh.read(1 << 16), b""):
+                        digest.update(block)
+                else:
+                    prefix = skip.encode("utf-8")
+                    for line in fh:
+                        if skipped is None and line.startswith(prefix):
+                            skipped = line.decode("utf-8")
+                            continue
+                        digest.update(line)
+        except OSError:
+            return None, None
+        return digest.digest(), skipped
+
+    def _write_json(
+        self, path: Path, data: Any, compact: bool = False, stamped: bool = False,
+    ) -> bool:
+        """Stream ``data`` into a sibling temp file, then ``os.replace`` it.
+
+        Readers (the Next.js dev server, a concurrent ``watch``) therefore see
+        either the old or the new file, never a half-written one. When the
+        result hashes the same as the existing file the temp file is dropped
+        and ``False`` returned, so mtimes only move on real changes. The new
+        text is hashed as it is written; only the existing file is read. With
+        ``stamped`` the ``lastUpdated`` line is ignored in that comparison and,
+        if nothing else changed, the previous stamp is put back into ``data``.
+        """
+        import hashlib
+
+        skip = _STAMP_LINE if stamped else None
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        digest = hashlib.sha256()
+        self.profile.count("open")
+        try:
+            with self.profile.phase("serialize"):
+                with tmp.open("w", encoding="utf-8", newline="\n") as fh:
+                    for chunk in self._digesting(self._json_chunks(data, compact), digest, skip):
+                        fh.write(chunk)
+            with self.profile.phase("write"):
+                old, old_stamp = self._file_digest(path, skip)
+                new = digest.digest()
+                if old is not None and old == new and (not stamped or old_stamp):
+                    tmp.unlink()
+                    if stamped:
+                        value = old_stamp[len(skip):].rstrip().rstrip(",")
+                        data["lastUpdated"] = json.loads(value)
+                    return False
+                self.profile.count("replace")
+                os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return True
+
+    def _write_stamped(self, path: Path, data: dict[str, Any]) -> bool:
+        """``_write_json`` for payloads carrying a ``lastUpdated`` stamp.
+
+        The previous stamp is kept while the rest of the payload is unchanged,
+        so an idle build leaves the file (and the site's build cache) alone.
+        Fills in ``data["lastUpdated"]`` and returns whether the file was written.
+        """
+        data["lastUpdated"] = self._timestamp()
+        return self._write_json(path, data, stamped=True)
+
+    def _read_json(self, path: Path) -> Any:
+        self.profile.count("open")
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _timestamp() -> str:
+        from datetime import datetime, timezone
+
+        return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
     @staticmethod
     def _write_text(path: Path, text: str, force: bool) -> None:
@@ -409,26 +1398,201 @@ python python/{title.lower().replace(' ', '-')}.py
         path.write_text(text, encoding="utf-8")
 
 
+# --------------------------------------------------------------------------- #
+# Change watchers
+# --------------------------------------------------------------------------- #
+
+class _PollingWatcher:
+    """Detects changed tools by re-fingerprinting the tree every ``interval``."""
+
+    name = "polling"
+
+    def __init__(self, registry: ScriptRegistry, interval: float) -> None:
+        self.registry = registry
+        self.interval = interval
+        self._snapshot = self._fingerprints()
+
+    def _fingerprints(self) -> dict[Path, Any]:
+        snapshot: dict[Path, Any] = {}
+        for _, tool_dir in self.registry.discover():
+            stat = self.registry._stat_tool(tool_dir)
+            snapshot[tool_dir] = stat[1] if stat else None
+        return snapshot
+
+    def wait(self, timeout: Optional[float]) -> set[Path]:
+        """Return the tool folders that changed, or an empty set on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+            current = self._fingerprints()
+            changed = {path for path in current.keys() | self._snapshot.keys()
+                       if current.get(path) != self._snapshot.get(path)}
+            self._snapshot = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifyWatcher:
+    """Linux inotify watches on ``scripts/`` down to the language folders."""
+
+    name = "inotify"
+
+    IN_MODIFY = 0x002
+    IN_ATTRIB = 0x004
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_DELETE_SELF = 0x400
+    IN_MOVE_SELF = 0x800
+    IN_Q_OVERFLOW = 0x4000
+    IN_IGNORED = 0x8000
+    IN_ISDIR = 0x40000000
+    MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+            | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+    #: scripts/ is depth 0, categories 1, tools 2, language folders 3.
+    MAX_DEPTH = 3
+
+    def __init__(self, scripts_path: Path) -> None:
+        import ctypes
+        import ctypes.util
+        import select
+        import struct
+
+        self._select = select.select
+        self._event = struct.Struct("iIII")
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._get_errno = ctypes.get_errno
+        self._add_watch = libc.inotify_add_watch  # AttributeError off Linux
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.scripts_path = scripts_path
+        self._watches: dict[int, tuple[Path, int]] = {}
+        self._add_tree(scripts_path, 0)
+
+    def _add_tree(self, path: Path, depth: int) -> None:
+        wd = self._add_watch(self.fd, os.fsencode(path), self.MASK)
+        if wd < 0:
+            logger.debug("Cannot watch %s: %s", path, os.strerror(self._get_errno()))
+            return
+        self._watches[wd] = (path, depth)
+        if depth < self.MAX_DEPTH:
+            for sub in ScriptRegistry._subdirs(path):
+                self._add_tree(Path(sub.path), depth + 1)
+
+    def wait(self, timeout: Optional[float]) -> set[Path]:
+        """Return the paths touched by pending events, or an empty set on timeout."""
+        ready, _, _ = self._select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self._event.unpack_from(data, offset)
+            offset += self._event.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                changed.add(self.scripts_path)  # events were lost: resync all
+                continue
+            if wd not in self._watches:
+                continue
+            base, depth = self._watches[wd]
+            if mask & self.IN_IGNORED:
+                del self._watches[wd]
+                continue
+            path = base / os.fsdecode(name) if name else base
+            if (mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO)
+                    and depth < self.MAX_DEPTH):
+                self._add_tree(path, depth + 1)
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _make_watcher(
+    registry: ScriptRegistry, poll_interval: float, force_poll: bool,
+) -> _PollingWatcher | _InotifyWatcher:
+    if not force_poll and sys.platform.startswith("linux"):
+        try:
+            return _InotifyWatcher(registry.scripts_path)
+        except (OSError, AttributeError) as exc:
+            logger.debug("inotify unavailable (%s); falling back to polling", exc)
+    return _PollingWatcher(registry, poll_interval)
+
+
 # --------------------------------------------------------------------------- #
 # Command handlers
 # --------------------------------------------------------------------------- #
 
+def _log_cache_stats(registry: ScriptRegistry) -> None:
+    logger.info("Cache: %d tool(s) reused, %d reparsed",
+                registry.stats["reused"], registry.stats["reparsed"])
+
+
 def cmd_scan(registry: ScriptRegistry, args: argparse.Namespace) -> int:
     tools = registry.scan_tools()
     registry.save_registry(tools)
     variants = sum(len(t["variants"]) for t in tools)
     logger.info("Found %d tool(s), %d variant(s)", len(tools), variants)
+    _log_cache_stats(registry)
     return 0
 
 
 def cmd_build(registry: ScriptRegistry, args: argparse.Namespace) -> int:
+    profile = None
+    if args.profile or args.profile_json:
+        profile = registry.profile = BuildProfile()
+
     tools = registry.scan_tools()
     registry.save_registry(tools)
     registry.generate_website_data(tools)
+    registry.generate_search_index(tools)
+    if args.shard:
+        registry.generate_shards(tools, args.shard, args.page_size)
+    _log_cache_stats(registry)
+
+    if profile is not None:
+        profile.stop()
+        if args.profile:
+            print(profile.format_table(args.profile_top))
+        if args.profile_json:
+            report = json.dumps(profile.report(args.profile_top), indent=2) + "\n"
+            if args.profile_json == "-":
+                sys.stdout.write(report)
+            else:
+                Path(args.profile_json).write_text(report, encoding="utf-8")
+                logger.info("Profile written to %s", args.profile_json)
     return 0
 
 
 def cmd_add(registry: ScriptRegistry, args: argparse.Namespace) -> int:
+    if args.from_manifest:
+        if args.tool or args.language:
+            raise ValueError("Give either <tool> <language> or --from-manifest, not both.")
+        return _add_from_manifest(registry, args)
+    if not (args.tool and args.language):
+        raise ValueError("add needs <tool> and <language>, or --from-manifest FILE.")
+
     variant_dir = registry.add_variant(
         args.tool, args.language, args.category, args.difficulty, args.force,
     )
@@ -440,21 +1604,76 @@ def cmd_add(registry: ScriptRegistry, args: argparse.Namespace) -> int:
     return 0
 
 
+def _add_from_manifest(registry: ScriptRegistry, args: argparse.Namespace) -> int:
+    items = registry.read_manifest(Path(args.from_manifest))
+    results = registry.add_variants(items, args.category, args.difficulty, args.force)
+    added = sum("path" in result for result in results)
+    logger.info("Scaffolded %d of %d variant(s) from %s",
+                added, len(results), args.from_manifest)
+
+    if added and not args.no_build:
+        tools = registry.scan_tools()
+        registry.save_registry(tools)
+        registry.generate_website_data(tools)
+        registry.generate_search_index(tools)
+    return 0 if added == len(results) else 1
+
+
+def cmd_watch(registry: ScriptRegistry, args: argparse.Namespace) -> int:
+    try:
+        registry.watch(args.debounce / 1000, args.interval, args.poll)
+    except KeyboardInterrupt:
+        logger.info("Stopped watching.")
+    return 0
+
+
+def _current_tools(registry: ScriptRegistry) -> list[dict[str, Any]]:
+    """The registry file when it is up to date, otherwise a (cached) rescan."""
+    tools = registry.load_fresh_registry()
+    return registry.scan_tools() if tools is None else tools
+
+
 def cmd_list(registry: ScriptRegistry, args: argparse.Namespace) -> int:
-    tools = registry.scan_tools()
+    tools = _current_tools(registry)
     by_category: dict[str, list[dict[str, Any]]] = {}
     for tool in tools:
         by_category.setdefault(tool["category"], []).append(tool)
 
+    lines = []
     for category in sorted(by_category):
         bucket = by_category[category]
-        print(f"\n{category} ({len(bucket)})")
+        lines.append(f"\n{category} ({len(bucket)})")
         for tool in bucket:
             langs = ", ".join(v["language"] for v in tool["variants"])
             star = "*" if tool["featured"] else " "
-            print(f"  {star} {tool['title']}  [{langs}]")
-    print(f"\nTotal: {len(tools)} tool(s), "
-          f"{sum(len(t['variants']) for t in tools)} variant(s)")
+            lines.append(f"  {star} {tool['title']}  [{langs}]")
+    lines.append(f"\nTotal: {len(tools)} tool(s), "
+                 f"{sum(len(t['variants']) for t in tools)} variant(s)")
+    print("\n".join(lines))
+    return 0
+
+
+def cmd_show(registry: ScriptRegistry, args: argparse.Namespace) -> int:
+    wanted = args.tool.strip().lower()
+    tool = next((t for t in _current_tools(registry)
+                 if t["key"] == slugify(wanted) or t["title"].lower() == wanted), None)
+    if tool is None:
+        raise ValueError(
+            f"No tool named '{args.tool}'. Run 'python script_manager.py list' to see them all."
+        )
+
+    print(f"{tool['title']}  ({tool['key']}){'  *featured*' if tool['featured'] else ''}")
+    print(f"  Category:    {tool['category']}")
+    print(f"  Difficulty:  {tool['difficulty']}")
+    print(f"  Path:        {tool['path']}")
+    print(f"\n  {tool['description']}")
+    if tool["features"]:
+        print("\n  Features:")
+        for feature in tool["features"]:
+            print(f"    - {feature}")
+    print("\n  Variants:")
+    for variant in tool["variants"]:
+        print(f"    {variant['language']:<12} {variant['path']}")
     return 0
 
 
@@ -473,6 +1692,8 @@ def build_parser() -> argparse.ArgumentParser:
             "  python script_manager.py add port-scanner python --category security\n"
             "  python script_manager.py add port-scanner bash      # add a variant\n"
             "  python script_manager.py list\n"
+            "  python script_manager.py show port-scanner\n"
+            "  python script_manager.py watch         # keep website data live\n"
         ),
     )
     parser.add_argument("--root", default=".", metavar="PATH",
@@ -481,6 +1702,10 @@ def build_parser() -> argparse.ArgumentParser:
                         help="Show debug-level logging.")
     parser.add_argument("-q", "--quiet", action="store_true",
                         help="Only show warnings and errors.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Reparse every tool, ignoring and not updating {CACHE_FILE}.")
+    parser.add_argument("-j", "--jobs", type=int, default=1, metavar="N",
+                        help="Scan tools with N worker threads (default: 1).")
 
     sub = parser.add_subparsers(dest="command", metavar="<command>", required=True)
 
@@ -489,17 +1714,36 @@ def build_parser() -> argparse.ArgumentParser:
 
     p_build = sub.add_parser(
         "build", help="Scan, update the registry and regenerate website data.")
+    p_build.add_argument("--shard", choices=SHARD_MODES,
+                         help="Also write a small index plus per-category or per-page "
+                              f"shards and per-tool files under data/{SHARD_DIR}/.")
+    p_build.add_argument("--page-size", type=int, default=50, metavar="N",
+                         help="Tools per page shard with --shard page (default: 50).")
+    p_build.add_argument("--profile", action="store_true",
+                         help="Print per-phase timings, call counts, peak memory and "
+                              "the slowest tools.")
+    p_build.add_argument("--profile-json", metavar="FILE",
+                         help="Write the profile as JSON to FILE ('-' for stdout).")
+    p_build.add_argument("--profile-top", type=int, default=10, metavar="N",
+                         help="How many of the slowest tools to report (default: 10).")
     p_build.set_defaults(func=cmd_build)
 
     p_add = sub.add_parser("add", help="Scaffold a new tool or language variant.")
-    p_add.add_argument("tool", help="Tool name (kebab-case recommended).")
-    p_add.add_argument("language", choices=sorted(SUPPORTED_LANGUAGES),
+    p_add.add_argument("tool", nargs="?", help="Tool name (kebab-case recommended).")
+    p_add.add_argument("language", nargs="?", choices=sorted(SUPPORTED_LANGUAGES),
                        help="Language variant to scaffold.")
+    p_add.add_argument("--from-manifest", metavar="FILE",
+                       help="Scaffold every tool/language listed in a .json or .csv "
+                            "manifest instead, then rebuild the data files once.")
+    p_add.add_argument("--no-build", action="store_true",
+                       help="With --from-manifest, skip the rebuild at the end.")
     p_add.add_argument("--category", default="utility",
                        help="Category folder for a NEW tool (default: utility). "
-                            "Ignored if the tool already exists.")
+                            "Ignored if the tool already exists; a manifest "
+                            "entry's own category takes precedence.")
     p_add.add_argument("--difficulty", default="Intermediate",
-                       help="Difficulty level for a new tool's README.")
+                       help="Difficulty level for a new tool's README (manifest "
+                            "entries may set their own).")
     p_add.add_argument("--force", action="store_true",
                        help="Overwrite existing files.")
     p_add.set_defaults(func=cmd_add)
@@ -507,6 +1751,20 @@ def build_parser() -> argparse.ArgumentParser:
     p_list = sub.add_parser("list", help="Print a summary of indexed tools.")
     p_list.set_defaults(func=cmd_list)
 
+    p_show = sub.add_parser("show", help="Print the details of one tool.")
+    p_show.add_argument("tool", help="Tool folder name or title.")
+    p_show.set_defaults(func=cmd_show)
+
+    p_watch = sub.add_parser(
+        "watch", help="Rebuild the data files whenever scripts/ changes.")
+    p_watch.add_argument("--debounce", type=int, default=200, metavar="MS",
+                         help="Quiet period before rebuilding, in ms (default: 200).")
+    p_watch.add_argument("--poll", action="store_true",
+                         help="Poll for changes instead of using inotify.")
+    p_watch.add_argument("--interval", type=float, default=1.0, metavar="SECONDS",
+                         help="Polling interval (default: 1.0).")
+    p_watch.set_defaults(func=cmd_watch)
+
     return parser
 
 
@@ -525,7 +1783,10 @@ def main(argv: Optional[list[str]] = None) -> int:
     args = parser.parse_args(argv)
     configure_logging(args.verbose, args.quiet)
 
-    registry = ScriptRegistry(args.root)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    registry = ScriptRegistry(args.root, use_cache=not args.no_cache, jobs=args.jobs)
     try:
         return args.func(registry, args)
     except (FileNotFoundError, FileExistsError, ValueError) as exc:
@@ -1,28 +1,525 @@
 #!/usr/bin/env python3
 """
 Advanced Duplicate File Finder
-Efficiently finds and manages duplicate files using MD5 hashing
+Efficiently finds and manages duplicate files using MD5 (or a faster/safer
+hash picked with --hash)
+
+Files are narrowed down in stages so that only real candidates are read in
+full: files with a unique size are dropped first, then files whose head/tail
+sample differs, and only what still collides is hashed completely - or, for
+groups of just a few files, compared byte by byte, which stops at the first
+difference.
 """
 
 import os
 import hashlib
 import argparse
+import csv
+import errno
+import heapq
+import itertools
+import json
 import logging
+import mmap
+import secrets
 import shutil
-from pathlib import Path
+import stat
+import sqlite3
+import tempfile
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from collections import defaultdict
-from typing import Dict, List, Set, Optional
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Set, Optional, TextIO
+
+# Optional fast hashes, offered by --hash when installed
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+# ioctl() for --action reflink; not available on Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Digest constructors selectable with --hash; md5 stays the default so
+# digests (and existing reports) remain comparable with older runs
+HASH_ALGORITHMS = {
+    "md5": hashlib.md5,
+    "sha256": hashlib.sha256,
+    "blake2b": hashlib.blake2b,
+}
+if blake3 is not None:
+    HASH_ALGORITHMS["blake3"] = blake3.blake3
+if xxhash is not None:
+    HASH_ALGORITHMS["xxh128"] = xxhash.xxh3_128
+DEFAULT_HASH = "md5"
+
+# Bytes sampled from each end of a file for the partial-hash stage
+PARTIAL_HASH_SIZE = 4096
+# Read size for full hashes; hashlib releases the GIL for buffers this large
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+# Files at least this large are hashed through mmap instead of read calls
+MMAP_THRESHOLD = 16 * 1024 * 1024
+# Candidate groups this small are compared byte by byte instead of hashed
+COMPARE_MAX_FILES = 3
+# Files held open at once by byte-by-byte comparisons, shared by all workers
+COMPARE_MAX_OPEN = 64
+# --max-memory mode: estimated bytes held per record besides its path, the
+# most runs merged at once, and files hashed per batch
+RECORD_OVERHEAD = 400
+MERGE_FAN_IN = 256
+HASH_BATCH = 1024
+# ioctl request that makes one file share another's extents (Linux: btrfs, XFS, ...)
+FICLONE = 0x40049409
+# Seconds between checkpoints of a scan's progress (--checkpoint)
+CHECKPOINT_INTERVAL = 30
+# errno values meaning the filesystem (or the pair of files) cannot be reflinked
+REFLINK_UNSUPPORTED = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EXDEV}
+# ... of which these rule out the whole filesystem
+REFLINK_UNSUPPORTED_FS = {errno.EOPNOTSUPP, errno.ENOTTY}
+
+def parse_size(text: str) -> int:
+    """Parse a byte count such as ``4096``, ``512M`` or ``2G`` (binary units)"""
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+    text = text.strip().upper().removesuffix("B")
+    try:
+        if text[-1:] in units:
+            return int(float(text[:-1]) * units[text[-1]])
+        return int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: '{text}'")
+
+class HashCache:
+    """SQLite store of partial and full digests, reused while a file is unchanged
+    
+    Rows are keyed by (device, inode) and only trusted while the file's size
+    and mtime_ns still match, so any edit, replacement or re-creation of a
+    file invalidates its digests. Digests from another hash algorithm are
+    never returned. Paths are stored as ``os.fsencode`` bytes, so names that
+    are not valid UTF-8 round-trip.
+    """
+    
+    SCHEMA_VERSION = 3
+    
+    def __init__(self, db_path: str, algorithm: str = DEFAULT_HASH):
+        self.algorithm = algorithm
+        self.conn = sqlite3.connect(db_path)
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            self.conn.execute("DROP TABLE IF EXISTS digests")
+            self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS digests (
+                dev INTEGER NOT NULL,
+                ino INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                path BLOB NOT NULL,
+                algorithm TEXT NOT NULL,
+                partial TEXT,
+                full TEXT,
+                PRIMARY KEY (dev, ino)
+            )""")
+        self.conn.commit()
+    
+    def get(self, info: tuple, kind: str) -> Optional[str]:
+        """Cached ``kind`` digest for a file's (dev, ino, size, mtime_ns), if still valid"""
+        row = self.conn.execute(
+            f"SELECT {kind} FROM digests WHERE dev = ? AND ino = ? AND size = ? AND mtime_ns = ? "
+            "AND algorithm = ?", (*info, self.algorithm)).fetchone()
+        return row[0] if row else None
+    
+    def put(self, info: tuple, path: str, kind: str, digest: str):
+        """Store a digest; the other kind is kept only if the file and algorithm are unchanged"""
+        other = "full" if kind == "partial" else "partial"
+        self.conn.execute(f"""
+            INSERT INTO digests (dev, ino, size, mtime_ns, path, algorithm, {kind})
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (dev, ino) DO UPDATE SET
+                {other} = CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns
+                                    AND algorithm = excluded.algorithm
+                               THEN {other} END,
+                size = excluded.size, mtime_ns = excluded.mtime_ns, path = excluded.path,
+                algorithm = excluded.algorithm, {kind} = excluded.{kind}""",
+            (*info, os.fsencode(os.path.abspath(path)), self.algorithm, digest))
+    
+    def mark_seen(self, infos: List[tuple]):
+        """Record the (dev, ino, size, mtime_ns) of files this scan stat'ed, for
+        ``prune`` without an in-memory ``seen`` (kept in a temporary table)"""
+        self.conn.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS seen (
+                dev INTEGER NOT NULL,
+                ino INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                PRIMARY KEY (dev, ino)
+            ) WITHOUT ROWID""")
+        self.conn.executemany("INSERT OR REPLACE INTO seen VALUES (?, ?, ?, ?)", infos)
+    
+    def _marked(self, key: tuple) -> Optional[tuple]:
+        return self.conn.execute("SELECT size, mtime_ns FROM seen WHERE dev = ? AND ino = ?",
+                                 key).fetchone()
+    
+    def prune(self, directory: str, seen: Optional[Dict[tuple, tuple]] = None) -> int:
+        """Delete rows under ``directory`` whose file is gone or has changed
+        
+        ``seen`` maps (dev, ino) to (size, mtime_ns) for the files this scan
+        stat'ed - or, if omitted, those passed to ``mark_seen``; other rows
+        under ``directory`` are checked with one stat each.
+        """
+        if seen is None:
+            self.mark_seen([])
+            lookup = self._marked
+        else:
+            lookup = seen.get
+        root = os.path.join(os.path.abspath(directory), "")
+        stale = []
+        for dev, ino, size, mtime_ns, path in self.conn.execute(
+                "SELECT dev, ino, size, mtime_ns, path FROM digests"):
+            path = os.fsdecode(path)
+            if not path.startswith(root):
+                continue
+            current = lookup((dev, ino))
+            if current is None:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    stale.append((dev, ino))
+                    continue
+                if (st.st_dev, st.st_ino) != (dev, ino):
+                    stale.append((dev, ino))
+                    continue
+                current = (st.st_size, st.st_mtime_ns)
+            if current != (size, mtime_ns):
+                stale.append((dev, ino))
+        self.conn.executemany("DELETE FROM digests WHERE dev = ? AND ino = ?", stale)
+        if seen is None:
+            self.conn.execute("DELETE FROM seen")
+        self.conn.commit()
+        return len(stale)
+    
+    def commit(self):
+        self.conn.commit()
+    
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+class ScanCheckpoint(HashCache):
+    """State file of a resumable scan: a ``HashCache`` for its completed digests
+    plus the walk position and the files walked so far
+    
+    The walk position is the stack of directories still to list, saved only
+    between directories, together with every file found up to that point.
+    """
+    
+    def __init__(self, db_path: str, algorithm: str = DEFAULT_HASH):
+        super().__init__(db_path, algorithm)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS scan (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS files (
+                path BLOB NOT NULL,
+                dev INTEGER NOT NULL,
+                ino INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                nlink INTEGER NOT NULL
+            )""")
+        self.conn.commit()
+    
+    def start(self, params: dict, resume: bool) -> Optional[List[str]]:
+        """Directories left to walk if a scan with these ``params`` is being
+        resumed, else ``None`` after clearing any earlier progress
+        
+        Raises ``ValueError`` when resuming a checkpoint of a different scan.
+        """
+        saved = dict(self.conn.execute("SELECT key, value FROM scan"))
+        if resume and saved:
+            if json.loads(saved["params"]) != params:
+                raise ValueError("the checkpoint belongs to a scan with different options "
+                                 f"({saved['params']})")
+            return json.loads(saved["pending"])
+        
+        self.conn.execute("DELETE FROM files")
+        self.conn.execute("DELETE FROM scan")
+        self.conn.execute("INSERT INTO scan VALUES ('params', ?)", (json.dumps(params),))
+        self.conn.execute("INSERT INTO scan VALUES ('pending', ?)", (json.dumps([params["directory"]]),))
+        self.conn.commit()
+        return None
+    
+    def files(self) -> Iterator[tuple]:
+        """``(path, (dev, ino, size, mtime_ns), nlink)`` of the files walked so far, in walk order
+        
+        Rows are streamed from the cursor, so a replay holds one at a time;
+        nothing writes to the table until the replay is over.
+        """
+        for path, dev, ino, size, mtime_ns, nlink in self.conn.execute(
+                "SELECT path, dev, ino, size, mtime_ns, nlink FROM files ORDER BY rowid"):
+            yield os.fsdecode(path), (dev, ino, size, mtime_ns), nlink
+    
+    def save(self, walked: List[tuple], pending: List[str]):
+        """Record newly walked files and the directories still to list, with
+        any digests stored since the last save"""
+        self.conn.executemany("INSERT INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                              [(os.fsencode(path), *info, nlink) for path, info, nlink in walked])
+        self.conn.execute("UPDATE scan SET value = ? WHERE key = 'pending'", (json.dumps(pending),))
+        self.conn.commit()
+
+class ExternalSorter:
+    """Sort more records than fit in memory
+    
+    Records (JSON-serialisable lists) are buffered until their estimated size
+    reaches ``memory_limit``, then sorted by ``key`` and spilled to a
+    temporary run file. Iterating merges the runs with ``heapq.merge``; the
+    sort is stable, so records with equal keys keep the order they were added in.
+    """
+    
+    def __init__(self, key: Callable[[list], object], memory_limit: int,
+                 temp_dir: Optional[str] = None):
+        self.key = key
+        self.memory_limit = memory_limit
+        self.temp_dir = temp_dir
+        self.buffer: List[list] = []
+        self.buffered = 0
+        self.runs = []
+    
+    def add(self, record: list):
+        self.buffer.append(record)
+        self.buffered += RECORD_OVERHEAD + len(record[-1])
+        if self.buffered >= self.memory_limit:
+            self._spill()
+    
+    def _spill(self):
+        """Write the buffer out as one sorted run"""
+        self.buffer.sort(key=self.key)
+        self.runs.append(self._write_run(self.buffer))
+        self.buffer, self.buffered = [], 0
+        if len(self.runs) >= MERGE_FAN_IN:
+            # Merge what we have into one run to keep open files bounded
+            merged = self._write_run(self._merge())
+            self.close()
+            self.runs = [merged]
+    
+    def _write_run(self, records: Iterable[list]):
+        run = tempfile.TemporaryFile("w+", encoding="utf-8", dir=self.temp_dir)
+        run.writelines(json.dumps(record) + "\n" for record in records)
+        run.seek(0)
+        return run
+    
+    def _merge(self) -> Iterator[list]:
+        for run in self.runs:
+            run.seek(0)
+        return heapq.merge(*(map(json.loads, run) for run in self.runs), key=self.key)
+    
+    def __iter__(self) -> Iterator[list]:
+        if not self.runs:
+            # Everything fit in memory
+            self.buffer.sort(key=self.key)
+            return iter(self.buffer)
+        if self.buffer:
+            self._spill()
+        return self._merge()
+    
+    def close(self):
+        for run in self.runs:
+            run.close()
+        self.runs = []
+        self.buffer, self.buffered = [], 0
+
+class SpilledGroups:
+    """Read-only ``{digest: paths}`` mapping backed by a temporary file
+    
+    Holds the final ``[size, ..., digest, dev, ino, mtime_ns, path]`` records
+    of a ``--max-memory`` scan, sorted so that each group is contiguous; only
+    the group being iterated over is loaded.
+    """
+    
+    def __init__(self, temp_dir: Optional[str] = None):
+        self.file = tempfile.TemporaryFile("w+", encoding="utf-8", dir=temp_dir)
+        self.count = 0
+    
+    def add(self, records: List[list]):
+        """Append one group's records"""
+        self.file.writelines(json.dumps(record) + "\n" for record in records)
+        self.count += 1
+    
+    def groups(self) -> Iterator[tuple]:
+        """``(digest, [(path, (dev, ino, size, mtime_ns)), ...])`` per group"""
+        self.file.flush()
+        self.file.seek(0)
+        records = map(json.loads, self.file)
+        for key, group in itertools.groupby(records, key=lambda record: record[:-4]):
+            yield key[-1], [self.entry(record) for record in group]
+    
+    @staticmethod
+    def entry(record: list) -> tuple:
+        """``(path, (dev, ino, size, mtime_ns))`` of a record"""
+        return record[-1], (record[-4], record[-3], record[0], record[-2])
+    
+    def items(self) -> Iterator[tuple]:
+        for digest, files in self.groups():
+            yield digest, [path for path, info in files]
+    
+    def keys(self) -> Iterator[str]:
+        return (digest for digest, paths in self.items())
+    
+    __iter__ = keys
+    
+    def values(self) -> Iterator[List[str]]:
+        return (paths for digest, paths in self.items())
+    
+    def __getitem__(self, digest: str) -> List[str]:
+        for key, paths in self.items():
+            if key == digest:
+                return paths
+        raise KeyError(digest)
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def close(self):
+        self.file.close()
+
+def group_match(key: str) -> tuple:
+    """``(match, digest)`` of a duplicate group's key
+    
+    Keys are a digest, ``collision:<digest>:<n>`` for the groups ``verify``
+    splits off a digest whose files differ, ``compared:<size>:<n>`` for groups
+    compared byte by byte, or ``inode:<dev>:<ino>`` for hardlinks only.
+    """
+    if key.startswith("compared:"):
+        return "bytes", None
+    if key.startswith("inode:"):
+        return "inode", None
+    if key.startswith("collision:"):
+        return "hash", key.split(":")[1]
+    return "hash", key
+
+class GroupWriter:
+    """Writes duplicate groups as JSON Lines (one group per line) or CSV (one
+    row per file, a group's rows together), flushing after every group
+    
+    Everything written comes from the scan's own stat data; ``reclaimable``
+    counts each inode once, as hardlinked paths free nothing when removed.
+    Digests are labelled with the ``algorithm`` that produced them.
+    """
+    
+    FORMATS = ("jsonl", "csv")
+    CSV_FIELDS = ["group", "match", "algorithm", "digest", "size", "path", "dev", "inode",
+                  "mtime_ns", "reclaimable"]
+    
+    def __init__(self, stream: TextIO, fmt: str, algorithm: str = DEFAULT_HASH):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown report format '{fmt}'. Available: {', '.join(self.FORMATS)}")
+        self.stream = stream
+        self.fmt = fmt
+        self.algorithm = algorithm
+        self.groups = 0
+        self.csv = None
+        if fmt == "csv":
+            self.csv = csv.writer(stream)
+            self.csv.writerow(self.CSV_FIELDS)
+    
+    def write(self, key: str, files: List[tuple]):
+        """Write one group of ``(path, (dev, ino, size, mtime_ns))`` entries"""
+        self.groups += 1
+        match, digest = group_match(key)
+        size = files[0][1][2]
+        
+        # The first path is the one kept; any other inode is space to win back
+        inodes = set()
+        reclaimable = []
+        for path, (dev, ino, _, _) in files:
+            reclaimable.append(size if inodes and (dev, ino) not in inodes else 0)
+            inodes.add((dev, ino))
+        
+        if self.csv:
+            self.csv.writerows([self.groups, match, self.algorithm, digest or "", size,
+                                path, dev, ino, mtime_ns, freed]
+                               for (path, (dev, ino, _, mtime_ns)), freed in zip(files, reclaimable))
+        else:
+            self.stream.write(json.dumps({
+                "group": self.groups,
+                "match": match,
+                "algorithm": self.algorithm,
+                "digest": digest,
+                "size": size,
+                "count": len(files),
+                "reclaimable": sum(reclaimable),
+                "files": [{"path": path, "dev": dev, "inode": ino, "mtime_ns": mtime_ns}
+                          for path, (dev, ino, _, mtime_ns) in files],
+            }) + "\n")
+        self.stream.flush()
 
 class DuplicateFinder:
-    def __init__(self):
+    def __init__(self, workers: int = 1, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 cache_path: Optional[str] = None, algorithm: str = DEFAULT_HASH,
+                 use_mmap: bool = True, mmap_threshold: int = MMAP_THRESHOLD,
+                 compare_max_files: int = COMPARE_MAX_FILES, verify: bool = False,
+                 max_memory: Optional[int] = None, temp_dir: Optional[str] = None,
+                 checkpoint_path: Optional[str] = None,
+                 checkpoint_interval: float = CHECKPOINT_INTERVAL):
         self.setup_logging()
+        if algorithm not in HASH_ALGORITHMS:
+            raise ValueError(f"Unknown hash algorithm '{algorithm}'. "
+                             f"Available: {', '.join(HASH_ALGORITHMS)}")
+        self.algorithm = algorithm
+        self.workers = workers
+        self.buffer_size = buffer_size
+        self.use_mmap = use_mmap
+        self.mmap_threshold = mmap_threshold
+        self.compare_max_files = compare_max_files
+        self.verify = verify
+        # With a memory budget, scans sort records on disk (see _scan_external)
+        self.max_memory = max_memory
+        self.temp_dir = temp_dir
+        # Receives each duplicate group as soon as it is final (see GroupWriter)
+        self.group_writer: Optional[GroupWriter] = None
+        self._stats_lock = threading.Lock()
+        # One reusable read buffer per hashing thread
+        self._buffers = threading.local()
         self.duplicates = defaultdict(list)
+        # (st_dev, st_ino, st_size, st_mtime_ns) of every file in the current scan
+        self.file_info: Dict[str, tuple] = {}
+        # Paths of every multiply-linked inode, keyed by (st_dev, st_ino); only
+        # the first path is hashed, the others are the same data by definition
+        self.hardlinks: Dict[tuple, List[str]] = {}
+        self.cache = None
+        if cache_path:
+            try:
+                self.cache = HashCache(cache_path, algorithm)
+            except sqlite3.Error as e:
+                self.logger.warning(f"Hash cache {cache_path} unavailable, hashing everything: {e}")
+        # Progress of the scan is saved here every ``checkpoint_interval``
+        # seconds; without --cache its digests are kept in the same file
+        self.checkpoint = None
+        self.checkpoint_interval = checkpoint_interval
+        self._last_checkpoint = time.monotonic()
+        if checkpoint_path:
+            try:
+                self.checkpoint = ScanCheckpoint(checkpoint_path, algorithm)
+                self.cache = self.cache or self.checkpoint
+            except sqlite3.Error as e:
+                self.logger.warning(f"Checkpoint file {checkpoint_path} unavailable, "
+                                    f"the scan will not be resumable: {e}")
         self.stats = {
             "files_scanned": 0,
             "duplicates_found": 0,
             "bytes_processed": 0,
+            "bytes_hashed": 0,
+            "bytes_compared": 0,
+            "cache_hits": 0,
+            "hardlinks": 0,
             "files_deleted": 0,
             "files_moved": 0,
+            "files_linked": 0,
             "space_saved": 0
         }
     
@@ -38,89 +535,664 @@ class DuplicateFinder:
         )
         self.logger = logging.getLogger(__name__)
     
-    def calculate_md5(self, file_path: str, chunk_size: int = 8192) -> str:
-        """Calculate MD5 hash of a file"""
-        hash_md5 = hashlib.md5()
+    def _count(self, stat: str, amount: int):
+        """Add to a statistic; safe to call from hashing worker threads"""
+        with self._stats_lock:
+            self.stats[stat] += amount
+    
+    def calculate_hash(self, file_path: str, chunk_size: Optional[int] = None,
+                       algorithm: Optional[str] = None) -> str:
+        """Calculate the hash of a file (``self.algorithm`` unless given)
+        
+        The hot loop allocates nothing per chunk: files of at least
+        ``mmap_threshold`` bytes are mapped and fed to the hash as
+        ``memoryview`` slices, smaller ones (or all, with ``use_mmap`` off)
+        are read with ``readinto`` into a per-thread buffer that is reused
+        from file to file.
+        """
+        file_hash = HASH_ALGORITHMS[algorithm or self.algorithm]()
+        chunk_size = chunk_size or self.buffer_size
+        bytes_read = 0
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            with open(file_path, "rb", buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                mapped = self._map(f, size)
+                if mapped is not None:
+                    with mapped, memoryview(mapped) as view:
+                        for offset in range(0, size, chunk_size):
+                            file_hash.update(view[offset:offset + chunk_size])
+                    bytes_read = size
+                else:
+                    buffer = self._read_buffer(chunk_size)
+                    for n in iter(lambda: f.readinto(buffer), 0):
+                        file_hash.update(buffer[:n])
+                        bytes_read += n
+            return file_hash.hexdigest()
         except (IOError, PermissionError) as e:
             self.logger.warning(f"Cannot read file {file_path}: {e}")
             return None
+        finally:
+            self._count("bytes_hashed", bytes_read)
     
-    def should_include_file(self, file_path: str, min_size: int, 
-                          file_extensions: Optional[List[str]]) -> bool:
-        """Check if file should be included in scan"""
+    def _map(self, f, size: int) -> Optional[mmap.mmap]:
+        """Read-only mapping of an open file if mmap applies, else ``None``"""
+        if not self.use_mmap or size < self.mmap_threshold:
+            return None
         try:
-            file_stat = os.stat(file_path)
-            
-            # Check size requirement
-            if file_stat.st_size < min_size:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"mmap unavailable for {f.name}, using reads: {e}")
+            return None
+    
+    def _read_buffer(self, size: int) -> memoryview:
+        """This thread's reusable read buffer of ``size`` bytes"""
+        view = getattr(self._buffers, "view", None)
+        if view is None or len(view) != size:
+            view = self._buffers.view = memoryview(bytearray(size))
+        return view
+    
+    def calculate_partial_hash(self, file_path: str, size: int,
+                               sample_size: int = PARTIAL_HASH_SIZE) -> Optional[str]:
+        """Calculate the hash of the first and last ``sample_size`` bytes of a file
+        
+        Files small enough to be covered by the samples are not read here (an
+        empty digest is returned); the full-hash stage reads them once instead.
+        """
+        if size <= 2 * sample_size:
+            return ""
+        file_hash = HASH_ALGORITHMS[self.algorithm]()
+        try:
+            with open(file_path, "rb") as f:
+                head = f.read(sample_size)
+                f.seek(-sample_size, os.SEEK_END)
+                tail = f.read(sample_size)
+            file_hash.update(head)
+            file_hash.update(tail)
+            self._count("bytes_hashed", len(head) + len(tail))
+            return file_hash.hexdigest()
+        except (IOError, PermissionError) as e:
+            self.logger.warning(f"Cannot read file {file_path}: {e}")
+            return None
+    
+    def should_include_file(self, name: str, size: int, min_size: int,
+                            file_extensions: Optional[FrozenSet[str]]) -> bool:
+        """Check if file should be included in scan
+        
+        ``file_extensions`` is a frozenset of lowercased suffixes (see
+        ``scan_directory``), so no per-file list is built and nothing is stat'ed.
+        """
+        # Check size requirement
+        if size < min_size:
+            return False
+        
+        # Check extension requirement (same rule as ``Path.suffix``)
+        if file_extensions:
+            dot = name.rfind(".")
+            file_ext = name[dot:].lower() if 0 < dot < len(name) - 1 else ""
+            if file_ext not in file_extensions:
                 return False
-            
-            # Check extension requirement
-            if file_extensions:
-                file_ext = Path(file_path).suffix.lower()
-                if file_ext not in [ext.lower() for ext in file_extensions]:
-                    return False
-            
-            return True
-        except (OSError, FileNotFoundError):
+        
+        return True
+    
+    def _walk(self, pending: List[str], recursive: bool) -> Iterator[Optional[os.DirEntry]]:
+        """Yield the files under the directories in ``pending`` in ``os.walk`` order,
+        via ``os.scandir``, and ``None`` after each directory
+        
+        Type checks come from the directory listing itself; like ``os.walk``,
+        symlinks to files are included and symlinked directories not entered.
+        Listings are consumed as they are read, so only subdirectory names are
+        held per directory. ``pending`` is the walk's own stack (directories
+        still to list, next one last): at a ``None`` it is a resumable position.
+        """
+        while pending:
+            current = pending.pop()
+            subdirs = []
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            elif entry.is_file():
+                                yield entry
+                        except OSError:
+                            continue
+            except OSError as e:
+                self.logger.warning(f"Cannot list directory {current}: {e}")
+                subdirs = []
+            if recursive:
+                pending.extend(reversed(subdirs))
+            yield None
+    
+    def _start_checkpoint(self, directory: str, min_size: int, extensions: Optional[FrozenSet[str]],
+                          recursive: bool, resume: bool) -> Optional[List[str]]:
+        """Directories left to walk when resuming from the checkpoint, else ``None``"""
+        if not self.checkpoint:
+            return None
+        # The directory as given, too: saved paths are relative to it
+        params = {"directory": directory, "root": os.path.abspath(directory), "min_size": min_size,
+                  "extensions": sorted(extensions) if extensions else None,
+                  "recursive": recursive, "algorithm": self.algorithm}
+        saved = self.checkpoint.start(params, resume)
+        if resume and saved is None:
+            self.logger.warning("No checkpoint to resume from, starting a new scan")
+        return saved
+    
+    def _walk_files(self, directory: str, min_size: int, extensions: Optional[FrozenSet[str]],
+                    recursive: bool, saved: Optional[List[str]] = None) -> Iterator[tuple]:
+        """``(path, (dev, ino, size, mtime_ns), nlink)`` of every file to scan
+        
+        With a checkpoint, the walk is saved between directories every
+        ``checkpoint_interval`` seconds. When resuming (``saved`` is the stack
+        of directories left), the files already walked are replayed first -
+        each stat'ed again, so files that changed since are not matched by
+        their saved digests, and files that are gone are dropped.
+        """
+        pending = [directory]
+        if saved is not None:
+            self.logger.info(f"Resuming: {len(saved)} directories left to walk")
+            for path, info, nlink in self.checkpoint.files():
+                st = self._stat_path(path, min_size, extensions)
+                if st is not None:
+                    yield path, (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns), st.st_nlink
+            pending = saved
+        
+        walked = []
+        for entry in self._walk(pending, recursive):
+            if entry is None:
+                if self.checkpoint and self._checkpoint_due():
+                    self.checkpoint.save(walked, pending)
+                    walked = []
+                continue
+            st = self._stat_entry(entry, min_size, extensions)
+            if st is None:
+                continue
+            file = (entry.path, (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns), st.st_nlink)
+            if self.checkpoint:
+                walked.append(file)
+            yield file
+        if self.checkpoint:
+            self.checkpoint.save(walked, [])
+    
+    def _checkpoint_due(self) -> bool:
+        """Whether ``checkpoint_interval`` has passed since the last checkpoint (restarting the clock)"""
+        now = time.monotonic()
+        if now - self._last_checkpoint < self.checkpoint_interval:
             return False
+        self._last_checkpoint = now
+        return True
     
     def scan_directory(self, directory: str, min_size: int = 0, 
                       file_extensions: Optional[List[str]] = None,
-                      recursive: bool = True) -> Dict[str, List[str]]:
-        """Scan directory for duplicate files"""
+                      recursive: bool = True, resume: bool = False) -> Dict[str, List[str]]:
+        """Scan directory for duplicate files
+        
+        Files are grouped by size, same-size files by a head/tail sample hash,
+        and only files that still collide are fully hashed - except groups of
+        at most ``compare_max_files``, which are compared byte by byte (their
+        keys are ``compared:<size>:<n>`` instead of a digest). With ``verify``
+        every hashed group is confirmed byte by byte as well, and files that
+        differ despite their digest get ``collision:<digest>:<n>`` keys. With
+        ``max_memory`` the scan runs on disk instead (see ``_scan_external``).
+        With a checkpoint file, ``resume`` continues an interrupted scan of the
+        same directory with the same options.
+        """
         self.logger.info(f"Scanning directory: {directory}")
         
         if not os.path.exists(directory):
             self.logger.error(f"Directory does not exist: {directory}")
             return {}
         
-        file_hashes = defaultdict(list)
+        self.file_info = {}
+        self.hardlinks = {}
+        extensions = frozenset(ext.lower() for ext in file_extensions) if file_extensions else None
+        try:
+            saved = self._start_checkpoint(directory, min_size, extensions, recursive, resume)
+        except ValueError as e:
+            self.logger.error(f"Cannot resume from checkpoint: {e}")
+            return {}
+        files = self._walk_files(directory, min_size, extensions, recursive, saved)
+        if self.max_memory:
+            return self._scan_external(directory, files)
         
+        files_by_size = defaultdict(list)
         # Walk through directory
-        if recursive:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    self._process_file(file_path, min_size, file_extensions, file_hashes)
-        else:
-            for file in os.listdir(directory):
-                file_path = os.path.join(directory, file)
-                if os.path.isfile(file_path):
-                    self._process_file(file_path, min_size, file_extensions, file_hashes)
+        for path, info, nlink in files:
+            self._add_file(path, info, nlink, files_by_size)
+        
+        # Stage 1: only files sharing their size with another file can be duplicates
+        groups = {(size,): paths for size, paths in files_by_size.items() if len(paths) > 1}
+        self.logger.info(f"{sum(len(paths) for paths in groups.values())} of "
+                        f"{self.stats['files_scanned']} files share their size with another file")
         
-        # Filter out files with unique hashes (no duplicates)
-        self.duplicates = {hash_val: paths for hash_val, paths in file_hashes.items() if len(paths) > 1}
+        # Stage 2: head/tail sample
+        groups = self._refine(groups, self.calculate_partial_hash, "partial")
+        
+        # Stage 3: compare small groups directly (unless their digests are cached
+        # anyway), fully hash the rest
+        small = {key: paths for key, paths in groups.items()
+                 if len(paths) <= self.compare_max_files and not self._all_cached(paths)}
+        compared = self._compare_groups(list(small.items()))
+        groups = self._refine({key: paths for key, paths in groups.items() if key not in small},
+                              lambda path, size: self.calculate_hash(path), "full")
+        
+        self.duplicates = {key[-1]: paths for key, paths in groups.items()}
+        if self.verify:
+            self.duplicates = self._verify_groups(self.duplicates)
+        for i, (key, paths) in enumerate(compared, 1):
+            self.duplicates[f"compared:{key[0]}:{i}"] = paths
+        self._add_hardlinks()
         self.stats["duplicates_found"] = len(self.duplicates)
+        if self.group_writer:
+            for key, files in self._groups():
+                self.group_writer.write(key, files)
         
-        self.logger.info(f"Scan complete: {self.stats['files_scanned']} files scanned, "
-                        f"{self.stats['duplicates_found']} duplicate groups found")
+        if self.cache:
+            seen = {info[:2]: info[2:] for info in self.file_info.values()}
+            pruned = self.cache.prune(directory, seen)
+            self.logger.info(f"Hash cache: {self.stats['cache_hits']} digests reused, "
+                            f"{pruned} stale entries pruned")
         
+        self._log_scan_complete()
         return dict(self.duplicates)
     
-    def _process_file(self, file_path: str, min_size: int, 
-                     file_extensions: Optional[List[str]], file_hashes: Dict):
-        """Process a single file for duplicate checking"""
-        if not self.should_include_file(file_path, min_size, file_extensions):
-            return
+    def _log_scan_complete(self):
+        self.logger.info(f"Scan complete ({self.algorithm}): {self.stats['files_scanned']} files scanned, "
+                        f"{self.format_bytes(self.stats['bytes_hashed'] + self.stats['bytes_compared'])} of "
+                        f"{self.format_bytes(self.stats['bytes_processed'])} read, "
+                        f"{self.stats['duplicates_found']} duplicate groups found")
+    
+    def _scan_external(self, directory: str, files: Iterable[tuple]) -> SpilledGroups:
+        """``scan_directory`` in about ``max_memory`` bytes, however many files
+        
+        The size, sample-hash and full-hash stages run on streams of
+        ``[size, <digests>, dev, ino, mtime_ns, path]`` records: each stage's
+        output goes through an ``ExternalSorter`` and the merged, sorted stream
+        is filtered to records whose key is shared with a neighbour before the
+        next stage hashes them. Groups come out ordered by size, and are
+        returned as a ``SpilledGroups`` mapping read back from disk. Hardlinks
+        are not folded together and every group is hashed (no byte-by-byte
+        comparison of small groups).
+        """
+        # At most two sorters hold records at once: one draining, one filling
+        limit = max(1, self.max_memory // 2)
+        by_size = ExternalSorter(lambda record: record[0], limit, self.temp_dir)
+        # Stat data for pruning the hash cache, kept in its database, not here
+        seen = []
+        for path, (dev, ino, size, mtime_ns), nlink in files:
+            by_size.add([size, dev, ino, mtime_ns, path])
+            if self.cache:
+                seen.append((dev, ino, size, mtime_ns))
+                if len(seen) >= HASH_BATCH:
+                    self.cache.mark_seen(seen)
+                    seen = []
+        if self.cache:
+            self.cache.mark_seen(seen)
+        self.logger.info(f"{self.stats['files_scanned']} files listed, "
+                        f"{len(by_size.runs)} sorted runs spilled to disk")
+        
+        stages = [(self.calculate_partial_hash, "partial"),
+                  (lambda path, size: self.calculate_hash(path), "full")]
+        records = by_size
+        for width, (hasher, kind) in enumerate(stages, 1):
+            refined = ExternalSorter(lambda record, n=width + 1: record[:n], limit, self.temp_dir)
+            for record in self._digest_stream(self._shared_key(records, width), hasher, kind):
+                refined.add(record)
+            records.close()
+            records = refined
+        
+        self.duplicates = SpilledGroups(self.temp_dir)
+        shared = self._shared_key(records, len(stages) + 1)
+        for key, group in itertools.groupby(shared, key=lambda record: record[:-4]):
+            group = list(group)
+            self.duplicates.add(group)
+            if self.group_writer:
+                self.group_writer.write(key[-1], [SpilledGroups.entry(record) for record in group])
+        records.close()
+        self.stats["duplicates_found"] = len(self.duplicates)
+        
+        if self.cache:
+            pruned = self.cache.prune(directory)
+            self.logger.info(f"Hash cache: {self.stats['cache_hits']} digests reused, "
+                            f"{pruned} stale entries pruned")
+        self._log_scan_complete()
+        return self.duplicates
+    
+    @staticmethod
+    def _shared_key(records: Iterable[list], width: int) -> Iterator[list]:
+        """Records of a sorted stream whose first ``width`` fields equal a neighbour's
+        
+        Keeps one record of lookahead, so groups of any size pass in constant memory.
+        """
+        pending, pending_key, shared = None, None, False
+        for record in records:
+            key = record[:width]
+            if key == pending_key:
+                if not shared:
+                    yield pending
+                    shared = True
+                yield record
+            else:
+                pending, pending_key, shared = record, key, False
+    
+    def _digest_stream(self, records: Iterable[list],
+                       hasher: Callable[[str, int], Optional[str]], kind: str) -> Iterator[list]:
+        """Insert ``hasher(path, size)`` before the dev field of each record
+        
+        Streaming counterpart of ``_refine``: records are taken ``HASH_BATCH``
+        at a time (hashed on the thread pool with more than one worker), cache
+        lookups and writes happen here, and unreadable files are dropped.
+        """
+        records = iter(records)
+        
+        def hash_job(record):
+            return hasher(record[-1], record[0])
         
+        done = 0
+        pool = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
         try:
-            file_hash = self.calculate_md5(file_path)
-            if file_hash:
-                file_hashes[file_hash].append(file_path)
-                self.stats["files_scanned"] += 1
-                self.stats["bytes_processed"] += os.path.getsize(file_path)
-                
-                if self.stats["files_scanned"] % 100 == 0:
-                    self.logger.info(f"Processed {self.stats['files_scanned']} files...")
+            for batch in iter(lambda: list(itertools.islice(records, HASH_BATCH)), []):
+                infos = [(record[-4], record[-3], record[0], record[-2]) for record in batch]
+                cached = [self._cached_digest(info, kind) for info in infos]
+                jobs = [record for record, digest in zip(batch, cached) if digest is None]
+                computed = pool.map(hash_job, jobs) if pool else map(hash_job, jobs)
+                for record, info, digest in zip(batch, infos, cached):
+                    if digest is None:
+                        digest = next(computed)
+                        if digest is not None and self.cache:
+                            self.cache.put(info, record[-1], kind, digest)
+                    if digest is not None:
+                        yield record[:-4] + [digest] + record[-4:]
+                done += len(batch)
+                if self.cache:
+                    self.cache.commit()
+                self.logger.info(f"{kind.capitalize()} hash: {done} files...")
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+            if self.cache:
+                self.cache.commit()
+    
+    def _refine(self, groups: Dict[tuple, List[str]],
+                hasher: Callable[[str, int], Optional[str]], kind: str) -> Dict[tuple, List[str]]:
+        """Split each candidate group by ``hasher(path, size)``, dropping singletons
+        
+        Group keys are tuples starting with the file size; each stage appends
+        its digest. Files that cannot be read are left out. Digests found in
+        the hash cache are used as-is; the rest are computed, on a thread pool
+        with more than one worker. Results are collected here, in the original
+        order, so grouping, progress and cache writes stay on this thread.
+        """
+        entries = [(key, path) for key, paths in groups.items() for path in paths]
+        cached = [self._cached_digest(self.file_info[path], kind) for key, path in entries]
+        jobs = [entry for entry, digest in zip(entries, cached) if digest is None]
+        
+        def hash_job(job):
+            key, path = job
+            return hasher(path, key[0])
+        
+        refined = defaultdict(list)
+        pool = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            computed = pool.map(hash_job, jobs) if pool else map(hash_job, jobs)
+            for done, ((key, path), digest) in enumerate(zip(entries, cached), 1):
+                if digest is None:
+                    digest = next(computed)
+                    if digest is not None and self.cache:
+                        self.cache.put(self.file_info[path], path, kind, digest)
+                if digest is not None:
+                    refined[key + (digest,)].append(path)
+                if done % 100 == 0:
+                    self.logger.info(f"{kind.capitalize()} hash: {done}/{len(entries)} files...")
+                if self.cache and self._checkpoint_due():
+                    self.cache.commit()
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+            if self.cache:
+                self.cache.commit()
+        
+        refined = {key: paths for key, paths in refined.items() if len(paths) > 1}
+        self.logger.info(f"After {kind} hash: {sum(len(paths) for paths in refined.values())} "
+                        f"candidate files in {len(refined)} groups")
+        return refined
+    
+    def _cached_digest(self, info: tuple, kind: str) -> Optional[str]:
+        """Digest from the hash cache for a file's (dev, ino, size, mtime_ns), if
+        enabled and the file is unchanged"""
+        if not self.cache:
+            return None
+        digest = self.cache.get(info, kind)
+        if digest is not None:
+            self.stats["cache_hits"] += 1
+        return digest
+    
+    def _all_cached(self, paths: List[str]) -> bool:
+        """Whether the hash cache already holds a full digest for every path"""
+        return bool(self.cache) and all(
+            self.cache.get(self.file_info[path], "full") is not None for path in paths)
+    
+    def compare_files(self, paths: List[str], chunk_size: Optional[int] = None) -> List[List[str]]:
+        """Split same-size files into groups of byte-identical files
+        
+        Unreadable files are left out (see ``_compare``).
+        """
+        return self._compare(paths, chunk_size)[0]
+    
+    def _compare(self, paths: List[str], chunk_size: Optional[int] = None) -> tuple:
+        """``(groups of byte-identical files, unreadable paths)`` for same-size files
+        
+        At most ``COMPARE_MAX_OPEN / workers`` files are open at a time. A
+        group that fits is read in lock-step in one go; a larger one is taken
+        apart by comparing its first file against the others, a batch at a
+        time, then doing the same with whatever did not match.
+        """
+        max_open = max(2, COMPARE_MAX_OPEN // self.workers)
+        if len(paths) <= max_open:
+            return self._lockstep(paths, chunk_size)
+        
+        identical = []
+        unreadable = []
+        remaining = list(paths)
+        while len(remaining) > 1:
+            reference, others = remaining[0], remaining[1:]
+            matched, rest = [], []
+            for i in range(0, len(others), max_open - 1):
+                batch = others[i:i + max_open - 1]
+                groups, failed = self._lockstep([reference] + batch, chunk_size)
+                unreadable.extend(failed)
+                if reference in failed:
+                    break
+                same = set(next((group for group in groups if group[0] == reference), []))
+                matched.extend(path for path in batch if path in same)
+                rest.extend(path for path in batch if path not in same and path not in failed)
+            else:
+                if matched:
+                    identical.append([reference] + matched)
+                remaining = rest
+                continue
+            # The reference itself could not be read: start over without it
+            skip = set(unreadable)
+            remaining = [path for path in others if path not in skip]
+        return identical, unreadable
+    
+    def _lockstep(self, paths: List[str], chunk_size: Optional[int] = None) -> tuple:
+        """``_compare`` with every file open at once
+        
+        All files are read in lock-step, one chunk at a time; a file whose
+        chunk differs from the others' is split off, and reading stops as soon
+        as no two files still agree, so the cost is proportional to the prefix
+        the files share rather than to their size.
+        """
+        chunk_size = chunk_size or self.buffer_size
+        handles = {}
+        identical = []
+        unreadable = []
+        try:
+            for path in paths:
+                try:
+                    handles[path] = open(path, "rb")
+                except (IOError, PermissionError) as e:
+                    self.logger.warning(f"Cannot read file {path}: {e}")
+                    unreadable.append(path)
+            
+            pending = [list(handles)] if len(handles) > 1 else []
+            while pending:
+                still_matching = []
+                for group in pending:
+                    # (chunk, paths reading that chunk) - at most a few per group
+                    variants = []
+                    for path in group:
+                        try:
+                            chunk = handles[path].read(chunk_size)
+                        except (IOError, PermissionError) as e:
+                            self.logger.warning(f"Cannot read file {path}: {e}")
+                            unreadable.append(path)
+                            continue
+                        self._count("bytes_compared", len(chunk))
+                        for seen, members in variants:
+                            if seen == chunk:
+                                members.append(path)
+                                break
+                        else:
+                            variants.append((chunk, [path]))
+                    
+                    for chunk, members in variants:
+                        if len(members) < 2:
+                            continue
+                        # Everyone hit end-of-file together: identical files
+                        (still_matching if chunk else identical).append(members)
+                pending = still_matching
+        finally:
+            for handle in handles.values():
+                handle.close()
+        
+        # Members keep the order they were given in; order groups the same way
+        order = {path: i for i, path in enumerate(paths)}
+        return sorted(identical, key=lambda group: order[group[0]]), unreadable
+    
+    def _compare_each(self, groups: List[tuple]) -> List[tuple]:
+        """``(key, identical groups, unreadable paths)`` for each ``(key, paths)``,
+        compared on the worker pool if any"""
+        def compare(group):
+            key, paths = group
+            return (key, *self._compare(paths))
+        
+        pool = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            return list(pool.map(compare, groups) if pool else map(compare, groups))
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+    
+    def _compare_groups(self, groups: List[tuple]) -> List[tuple]:
+        """``compare_files`` for each ``(key, paths)``, on the worker pool if any
         
-        except Exception as e:
-            self.logger.warning(f"Error processing {file_path}: {e}")
+        Returns ``(key, paths)`` for every group of identical files found.
+        """
+        identical = [(key, paths) for key, found, unreadable in self._compare_each(groups)
+                     for paths in found]
+        if groups:
+            self.logger.info(f"Compared {len(groups)} small groups byte by byte: "
+                            f"{len(identical)} duplicate groups")
+        return identical
+    
+    def _verify_groups(self, duplicates: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Confirm hashed groups byte by byte, splitting or dropping any that differ
+        
+        Files that cannot be read are dropped with a warning of their own; only
+        readable files that differ are reported as a hash collision.
+        """
+        verified = {}
+        for key, found, unreadable in self._compare_each(list(duplicates.items())):
+            readable = len(duplicates[key]) - len(unreadable)
+            if readable > 1 and (len(found) != 1 or len(found[0]) != readable):
+                self.logger.warning(f"Hash collision: files with digest {key} differ")
+            for i, group in enumerate(found):
+                verified[key if i == 0 else f"collision:{key}:{i}"] = group
+        self.logger.info(f"Verified {len(duplicates)} hashed groups byte by byte")
+        return verified
+    
+    def _add_hardlinks(self):
+        """Put hardlinked paths back next to the path that was hashed for them
+        
+        Sets of hardlinks with no other duplicate still form their own group,
+        keyed ``inode:<dev>:<ino>``.
+        """
+        grouped = set()
+        for key, paths in self.duplicates.items():
+            expanded = []
+            for path in paths:
+                info = self.file_info[path]
+                links = self.hardlinks.get(info[:2], [path])
+                expanded.extend(links)
+                grouped.add(info[:2])
+            self.duplicates[key] = expanded
+        
+        for (dev, ino), paths in self.hardlinks.items():
+            if len(paths) > 1 and (dev, ino) not in grouped:
+                self.duplicates[f"inode:{dev}:{ino}"] = paths
+    
+    def _stat_entry(self, entry: os.DirEntry, min_size: int,
+                    file_extensions: Optional[FrozenSet[str]]) -> Optional[os.stat_result]:
+        """Stat a walked file once and count it; ``None`` if it is filtered out or unreadable"""
+        try:
+            # DirEntry.stat() leaves st_ino/st_dev/st_nlink zero on Windows
+            st = entry.stat() if os.name != "nt" else os.stat(entry.path)
+        except OSError as e:
+            self.logger.warning(f"Error processing {entry.path}: {e}")
+            return None
+        return self._counted(entry.name, st, min_size, file_extensions)
+    
+    def _stat_path(self, path: str, min_size: int,
+                   file_extensions: Optional[FrozenSet[str]]) -> Optional[os.stat_result]:
+        """``_stat_entry`` for a bare path; ``None`` if it is gone or filtered out"""
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            self.logger.warning(f"Error processing {path}: {e}")
+            return None
+        return self._counted(os.path.basename(path), st, min_size, file_extensions)
+    
+    def _counted(self, name: str, st: os.stat_result, min_size: int,
+                 file_extensions: Optional[FrozenSet[str]]) -> Optional[os.stat_result]:
+        if not self.should_include_file(name, st.st_size, min_size, file_extensions):
+            return None
+        self._count_file(st.st_size)
+        return st
+    
+    def _count_file(self, size: int):
+        self.stats["files_scanned"] += 1
+        self.stats["bytes_processed"] += size
+        if self.stats["files_scanned"] % 100 == 0:
+            self.logger.info(f"Processed {self.stats['files_scanned']} files...")
+    
+    def _add_file(self, file_path: str, info: tuple, nlink: int, files_by_size: Dict):
+        """Process a single file for duplicate checking
+        
+        The file was stat'ed exactly once; its size, mtime and inode are kept
+        in ``file_info`` for every later stage.
+        """
+        size = info[2]
+        self.file_info[file_path] = info
+        
+        if nlink > 1:
+            links = self.hardlinks.setdefault(info[:2], [])
+            links.append(file_path)
+            if len(links) > 1:
+                # Same inode as a file already queued: identical without reading it
+                self.stats["hardlinks"] += 1
+                return
+        files_by_size[size].append(file_path)
+    
+    def _groups(self) -> Iterator[tuple]:
+        """``(key, [(path, (dev, ino, size, mtime_ns)), ...])`` per duplicate group,
+        from the stat data gathered while scanning"""
+        if isinstance(self.duplicates, SpilledGroups):
+            yield from self.duplicates.groups()
+            return
+        for key, paths in self.duplicates.items():
+            yield key, [(path, self.file_info[path]) for path in paths]
     
     def display_duplicates(self, show_sizes: bool = True):
         """Display found duplicates"""
@@ -204,14 +1276,148 @@ class DuplicateFinder:
                 except Exception as e:
                     self.logger.error(f"Error moving {file_path}: {e}")
     
-    def generate_report(self, output_file: Optional[str] = None):
-        """Generate a detailed report of duplicates"""
+    def link_duplicates(self, mode: str = "hardlink", keep_original: bool = True,
+                        dry_run: bool = False):
+        """Replace duplicates in place with hardlinks or reflinks of the kept file
+        
+        A reflink (``FICLONE``) is a copy-on-write clone: a separate file that
+        shares the original's blocks, keeping its own name, mode and times. Each
+        link is made under a temporary name in the duplicate's directory and
+        renamed over it, so the path never disappears or holds partial data.
+        Paths already sharing the original's inode, symlinks, other filesystems
+        and files changed since the scan are skipped. Where reflinks are not
+        supported the duplicate is left as it is; once a filesystem turns out
+        not to support them at all, its remaining groups are skipped.
+        """
         if not self.duplicates:
+            self.logger.info("No duplicates to link")
+            return
+        if mode == "reflink" and fcntl is None:
+            self.logger.error("Reflinks are not supported on this platform")
             return
         
-        report_lines = [
+        prefix = "[DRY RUN] " if dry_run else ""
+        verb = "Hardlinked" if mode == "hardlink" else "Reflinked"
+        self.logger.info(f"{prefix}Replacing duplicates with {mode}s...")
+        
+        no_reflinks = set()  # devices whose filesystem cannot reflink
+        for key, files in self._groups():
+            original, info = files[0] if keep_original else files[-1]
+            if info[0] in no_reflinks:
+                continue
+            if self._scanned_stat(original, info) is None:
+                self.logger.warning(f"Leaving the group of {original} as it is")
+                continue
+            
+            for path, path_info in files:
+                if path_info[:2] == info[:2]:
+                    continue  # the original itself, or already a hardlink of it
+                if path_info[0] != info[0]:
+                    self.logger.warning(f"Skipping {path}: on another filesystem than {original}")
+                    continue
+                st = self._scanned_stat(path, path_info)
+                if st is None:
+                    continue
+                
+                try:
+                    if not dry_run:
+                        if mode == "hardlink":
+                            self._replace_with_hardlink(original, path)
+                        else:
+                            self._replace_with_reflink(original, path)
+                        self.stats["files_linked"] += 1
+                        if st.st_nlink == 1:
+                            # Otherwise the data lives on under another name
+                            self.stats["space_saved"] += info[2]
+                    self.logger.info(f"{prefix}{verb}: {path} → {original}")
+                except OSError as e:
+                    if mode == "reflink" and e.errno in REFLINK_UNSUPPORTED_FS:
+                        no_reflinks.add(info[0])
+                        self.logger.warning(f"Reflinks unsupported on the filesystem of {path} "
+                                            f"({e.strerror}); leaving its duplicates as they are")
+                        break
+                    if mode == "reflink" and e.errno in REFLINK_UNSUPPORTED:
+                        self.logger.warning(f"Reflinks unsupported for {path} ({e.strerror}); left as it is")
+                    else:
+                        self.logger.error(f"Error linking {path}: {e}")
+    
+    def _scanned_stat(self, path: str, info: tuple) -> Optional[os.stat_result]:
+        """``lstat`` of ``path`` if it is still the regular file the scan saw,
+        else ``None`` (and a warning)"""
+        try:
+            st = os.lstat(path)
+        except OSError as e:
+            self.logger.warning(f"Skipping {path}: {e}")
+            return None
+        if stat.S_ISLNK(st.st_mode):
+            self.logger.warning(f"Skipping {path}: it is a symlink")
+            return None
+        if not stat.S_ISREG(st.st_mode) or (
+                st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns) != tuple(info):
+            self.logger.warning(f"Skipping {path}: it changed since the scan")
+            return None
+        return st
+    
+    @staticmethod
+    def _temp_name(path: str) -> str:
+        """Unused hidden name next to ``path``, for replacing it by rename"""
+        directory, name = os.path.split(path)
+        return os.path.join(directory, f".{name}.{secrets.token_hex(4)}.tmp")
+    
+    def _replace_with_hardlink(self, original: str, path: str):
+        temp = self._temp_name(path)
+        os.link(original, temp)
+        try:
+            os.replace(temp, path)
+        finally:
+            # rename() between two links of one inode succeeds without doing anything
+            if os.path.lexists(temp):
+                os.remove(temp)
+    
+    def _replace_with_reflink(self, original: str, path: str):
+        temp = self._temp_name(path)
+        fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            try:
+                with open(original, "rb") as src:
+                    fcntl.ioctl(fd, FICLONE, src.fileno())
+            finally:
+                os.close(fd)
+            shutil.copystat(path, temp)
+            st = os.stat(path)
+            try:
+                os.chown(temp, st.st_uid, st.st_gid)
+            except PermissionError:
+                pass
+            os.replace(temp, path)
+        except BaseException:
+            os.remove(temp)
+            raise
+    
+    def generate_report(self, output_file: Optional[str] = None, fmt: str = "text"):
+        """Generate a detailed report of duplicates
+        
+        ``fmt`` is ``text``, or ``jsonl``/``csv`` for the machine-readable
+        layouts of ``GroupWriter``. The report is written group by group.
+        """
+        if not self.duplicates:
+            return
+        
+        with open(output_file, 'w', encoding='utf-8', newline='') if output_file else nullcontext(sys.stdout) as f:
+            if fmt == "text":
+                self._write_text_report(f)
+            else:
+                writer = GroupWriter(f, fmt, self.algorithm)
+                for key, files in self._groups():
+                    writer.write(key, files)
+        if output_file:
+            self.logger.info(f"Report saved to: {output_file}")
+    
+    def _write_text_report(self, f: TextIO):
+        header = [
             "DUPLICATE FILES REPORT",
             "=" * 50,
+            f"Hash algorithm: {self.algorithm}",
             f"Total duplicate groups: {len(self.duplicates)}",
             f"Total files scanned: {self.stats['files_scanned']}",
             f"Total bytes processed: {self.format_bytes(self.stats['bytes_processed'])}",
@@ -219,27 +1425,66 @@ class DuplicateFinder:
             "DUPLICATE GROUPS:",
             "-" * 30
         ]
+        f.write("\n".join(header))
         
-        for i, (hash_val, paths) in enumerate(self.duplicates.items(), 1):
-            report_lines.append(f"\nGroup {i}:")
-            report_lines.append(f"  Hash: {hash_val}")
-            try:
-                size = os.path.getsize(paths[0])
-                report_lines.append(f"  Size: {self.format_bytes(size)}")
-            except:
-                pass
-            
-            for path in paths:
-                report_lines.append(f"    {path}")
-        
-        report_content = "\n".join(report_lines)
+        for i, (hash_val, files) in enumerate(self._groups(), 1):
+            lines = [f"\nGroup {i}:"]
+            match, digest = group_match(hash_val)
+            if match == "bytes":
+                lines.append("  Hash: - (confirmed byte by byte)")
+            elif match == "inode":
+                lines.append("  Hash: - (hardlinks of one file)")
+            else:
+                lines.append(f"  Hash: {digest}")
+            lines.append(f"  Size: {self.format_bytes(files[0][1][2])}")
+            lines.extend(f"    {path}" for path, info in files)
+            f.write("\n" + "\n".join(lines))
+        f.write("\n")
+    
+    def benchmark_hashes(self, directory: str, size_mb: int = 256) -> Dict[str, float]:
+        """Measure read+hash throughput in MB/s for every available algorithm
         
-        if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(report_content)
-            self.logger.info(f"Report saved to: {output_file}")
-        else:
-            print(report_content)
+        A temporary file of ``size_mb`` random MB is written to ``directory``
+        (so the disk under test is the one that will be scanned) and hashed
+        with each algorithm through the same code path as a scan. Where the
+        OS allows it, the file is evicted from the page cache before each
+        run so every algorithm reads from disk.
+        """
+        chunk = os.urandom(1024 * 1024)
+        results = {}
+        fd, path = tempfile.mkstemp(prefix=".dupfinder-bench-", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for _ in range(size_mb):
+                    f.write(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+            
+            for algorithm in ["read only", *HASH_ALGORITHMS]:
+                self._drop_page_cache(path)
+                start = time.perf_counter()
+                if algorithm == "read only":
+                    with open(path, "rb") as f:
+                        while f.read(self.buffer_size):
+                            pass
+                else:
+                    self.calculate_hash(path, algorithm=algorithm)
+                results[algorithm] = size_mb / (time.perf_counter() - start)
+                self.logger.info(f"{algorithm}: {results[algorithm]:.1f} MB/s")
+        finally:
+            os.remove(path)
+        return results
+    
+    @staticmethod
+    def _drop_page_cache(path: str):
+        """Ask the OS to forget cached pages of ``path`` (no-op where unsupported)"""
+        if not hasattr(os, "posix_fadvise"):
+            return
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
     
     def format_bytes(self, bytes_val: int) -> str:
         """Format bytes in human readable format"""
@@ -256,9 +1501,15 @@ class DuplicateFinder:
         print("="*60)
         print(f"Files scanned: {self.stats['files_scanned']}")
         print(f"Bytes processed: {self.format_bytes(self.stats['bytes_processed'])}")
+        print(f"Bytes hashed: {self.format_bytes(self.stats['bytes_hashed'])}")
+        print(f"Bytes compared: {self.format_bytes(self.stats['bytes_compared'])}")
+        print(f"Hardlinks (not re-read): {self.stats['hardlinks']}")
+        if self.cache:
+            print(f"Digests reused from cache: {self.stats['cache_hits']}")
         print(f"Duplicate groups found: {self.stats['duplicates_found']}")
         print(f"Files deleted: {self.stats['files_deleted']}")
         print(f"Files moved: {self.stats['files_moved']}")
+        print(f"Files linked: {self.stats['files_linked']}")
         print(f"Space saved: {self.format_bytes(self.stats['space_saved'])}")
         print("="*60)
 
@@ -273,56 +1524,157 @@ def main():
                        help="Scan subdirectories recursively")
     parser.add_argument("--no-recursive", action="store_false", dest="recursive",
                        help="Don't scan subdirectories")
-    parser.add_argument("-a", "--action", choices=["list", "delete", "move"], 
-                       default="list", help="Action to take on duplicates")
+    parser.add_argument("-a", "--action", choices=["list", "delete", "move", "hardlink", "reflink"],
+                       default="list", help="Action to take on duplicates; hardlink and reflink "
+                                            "replace duplicates in place with links to the kept file")
     parser.add_argument("-d", "--destination", help="Destination folder for move action")
     parser.add_argument("--dry-run", action="store_true", 
                        help="Preview actions without making changes")
     parser.add_argument("-o", "--output", help="Output file for report")
+    parser.add_argument("-f", "--format", choices=["text", *GroupWriter.FORMATS], default="text",
+                       help="Report format (default: text). jsonl and csv go to --output, or "
+                            "else to stdout, one flushed group at a time: at the end of the scan, "
+                            "or while it runs with --max-memory")
     parser.add_argument("--keep-newest", action="store_true",
                        help="Keep newest file instead of first found")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                       help="Hash files on N threads (default: 1)")
+    parser.add_argument("--buffer-size", type=int, default=DEFAULT_BUFFER_SIZE,
+                       help=f"Read buffer for hashing in bytes (default: {DEFAULT_BUFFER_SIZE})")
+    parser.add_argument("--no-mmap", action="store_false", dest="use_mmap",
+                       help="Hash large files with buffered reads instead of mmap "
+                            "(for filesystems where mmap is slow, e.g. some network mounts)")
+    parser.add_argument("--mmap-threshold", type=int, default=MMAP_THRESHOLD, metavar="BYTES",
+                       help=f"Smallest file hashed through mmap (default: {MMAP_THRESHOLD})")
+    parser.add_argument("--compare-max", type=int, default=COMPARE_MAX_FILES, metavar="N",
+                       help="Compare candidate groups of up to N files byte by byte "
+                            f"instead of hashing them (default: {COMPARE_MAX_FILES}; 0 = always hash)")
+    parser.add_argument("--verify", action="store_true",
+                       help="Confirm hashed duplicate groups with a byte-by-byte comparison")
+    parser.add_argument("--max-memory", type=parse_size, metavar="SIZE",
+                       help="Bound memory use to about SIZE (e.g. 512M, 2G) by sorting file "
+                            "records in temporary files; for trees too large to scan in memory")
+    parser.add_argument("--temp-dir", metavar="DIR",
+                       help="Directory for --max-memory's temporary files (default: system temp)")
+    parser.add_argument("--cache", metavar="DB",
+                       help="SQLite file for reusing digests of unchanged files between scans")
+    parser.add_argument("--checkpoint", metavar="FILE",
+                       help="Save the scan's progress (walk position and digests) to FILE "
+                            "periodically, so that an interrupted scan can be resumed")
+    parser.add_argument("--resume", action="store_true",
+                       help="Continue the interrupted scan recorded in --checkpoint")
+    parser.add_argument("--checkpoint-interval", type=float, default=CHECKPOINT_INTERVAL,
+                       metavar="SECONDS",
+                       help=f"Seconds between checkpoints (default: {CHECKPOINT_INTERVAL})")
+    parser.add_argument("--hash", choices=sorted(HASH_ALGORITHMS), default=DEFAULT_HASH,
+                       help=f"Hash algorithm (default: {DEFAULT_HASH}; blake3 and xxh128 "
+                            "are offered when their packages are installed)")
+    parser.add_argument("--benchmark", action="store_true",
+                       help="Report hashing speed (MB/s) of each algorithm on the "
+                            "directory's disk instead of scanning")
+    parser.add_argument("--benchmark-size", type=int, default=256, metavar="MB",
+                       help="Size of the benchmark's temporary file (default: 256)")
     
     args = parser.parse_args()
     
     # Validate arguments
     if args.action == "move" and not args.destination:
         parser.error("--destination is required when using move action")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.buffer_size < 1:
+        parser.error("--buffer-size must be at least 1")
+    if args.max_memory is not None and args.max_memory < 1:
+        parser.error("--max-memory must be at least 1 byte")
+    if args.max_memory and args.verify:
+        parser.error("--verify is not supported with --max-memory")
+    if args.resume and not args.checkpoint:
+        parser.error("--resume requires --checkpoint")
     
     # Create finder instance
-    finder = DuplicateFinder()
+    finder = DuplicateFinder(workers=args.workers, buffer_size=args.buffer_size,
+                             cache_path=args.cache, algorithm=args.hash,
+                             use_mmap=args.use_mmap, mmap_threshold=args.mmap_threshold,
+                             compare_max_files=args.compare_max, verify=args.verify,
+                             max_memory=args.max_memory, temp_dir=args.temp_dir,
+                             checkpoint_path=args.checkpoint,
+                             checkpoint_interval=args.checkpoint_interval)
+    
+    if args.benchmark:
+        results = finder.benchmark_hashes(args.directory, args.benchmark_size)
+        print(f"\nHashing throughput on {args.directory} ({args.benchmark_size} MB file):")
+        for algorithm, rate in sorted(results.items(), key=lambda item: -item[1]):
+            print(f"  {algorithm:<10} {rate:>10.1f} MB/s")
+        return
+    
+    # Machine-readable reports are written while scanning, and replace the
+    # listing on stdout when they go there
+    streamed = args.format != "text"
+    report = None
+    if streamed:
+        report = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+        finder.group_writer = GroupWriter(report, args.format, finder.algorithm)
     
     # Scan for duplicates
-    duplicates = finder.scan_directory(
-        args.directory,
-        args.min_size,
-        args.extensions,
-        args.recursive
-    )
+    try:
+        duplicates = finder.scan_directory(
+            args.directory,
+            args.min_size,
+            args.extensions,
+            args.recursive,
+            resume=args.resume
+        )
+    finally:
+        if report is not None and report is not sys.stdout:
+            report.close()
+            finder.logger.info(f"Report saved to: {args.output}")
+    if finder.cache:
+        finder.cache.close()
+    if finder.checkpoint and finder.checkpoint is not finder.cache:
+        finder.checkpoint.close()
     
+    quiet = streamed and not args.output
     if not duplicates:
-        print("No duplicates found!")
+        if not quiet:
+            print("No duplicates found!")
         return
     
     # Display results
-    finder.display_duplicates()
+    if not quiet:
+        finder.display_duplicates()
+    
+    def confirm(question: str) -> bool:
+        if args.dry_run:
+            return True
+        # A streamed report owns stdout, so ask on stderr instead
+        print(question, end="", file=sys.stderr if quiet else sys.stdout, flush=True)
+        return input().lower() == 'y'
     
     # Perform requested action
     if args.action == "delete":
-        if args.dry_run or input("\nDelete duplicates? (y/N): ").lower() == 'y':
+        if confirm("\nDelete duplicates? (y/N): "):
             finder.delete_duplicates(
                 keep_original=not args.keep_newest,
                 dry_run=args.dry_run
             )
     elif args.action == "move":
-        if args.dry_run or input(f"\nMove duplicates to {args.destination}? (y/N): ").lower() == 'y':
+        if confirm(f"\nMove duplicates to {args.destination}? (y/N): "):
             finder.move_duplicates(args.destination, args.dry_run)
+    elif args.action in ("hardlink", "reflink"):
+        if confirm(f"\nReplace duplicates with {args.action}s? (y/N): "):
+            finder.link_duplicates(
+                args.action,
+                keep_original=not args.keep_newest,
+                dry_run=args.dry_run
+            )
     
     # Generate report if requested
-    if args.output:
+    if args.output and not streamed:
         finder.generate_report(args.output)
     
     # Print statistics
-    finder.print_statistics()
+    if not quiet:
+        finder.print_statistics()
 
 if __name__ == "__main__":
     main()